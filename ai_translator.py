@@ -13,128 +13,25 @@ Features:
 - Generates comprehensive translation context
 """
 
+import io
 import os
 import re
-import yaml
+import sys
+from dataclasses import asdict, is_dataclass
+from functools import cached_property
 from typing import List, Dict, Optional, Tuple
 from pathlib import Path
 
+from yaml_cache import load_yaml_cached
+
+
+# Byte classes used when walking back from "ClassName::" to the return type
+_SPACE_BYTES = frozenset(b' \t\n\r\f\v')
+_TYPE_TOKEN_BYTES = frozenset(b'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789_:')
 
-class AITranslator:
-    """Generates AI context for TServer to TNG translation"""
-    
-    def __init__(self, spec_file: str, original_cpp: str, mappings_file: str = None, 
-                 tng_path: str = None, tng_output_dir: str = None, tng_reference_file: str = None):
-        """
-        Initialize the AI translator.
-        
-        Args:
-            spec_file: Path to the test specification YAML
-            original_cpp: Path to the original TServer .cpp file
-            mappings_file: Path to API mappings YAML
-            tng_path: Path to TNG source code (diag_tng)
-            tng_output_dir: Relative path within TNG for output
-            tng_reference_file: Path to existing TNG test file (for reference)
-        """
-        self.spec_file = spec_file
-        self.original_cpp = original_cpp
-        self.tng_path = tng_path
-        self.tng_output_dir = tng_output_dir
-        self.tng_reference_file = tng_reference_file
-        
-        # Load specification
-        with open(spec_file, 'r') as f:
-            self.spec = yaml.safe_load(f)
-        
-        # Load original C++ code
-        with open(original_cpp, 'r') as f:
-            self.cpp_content = f.read()
-        
-        # Load TNG reference if provided
-        self.tng_reference_content = None
-        if tng_reference_file and os.path.exists(tng_reference_file):
-            with open(tng_reference_file, 'r') as f:
-                self.tng_reference_content = f.read()
-        
-        # Load mappings
-        mappings_file = mappings_file or str(Path(__file__).parent / "api_mappings.yaml")
-        if os.path.exists(mappings_file):
-            with open(mappings_file, 'r') as f:
-                self.mappings = yaml.safe_load(f)
-        else:
-            self.mappings = {}
-    
-    def extract_function(self, func_name: str) -> Optional[str]:
-        """Extract a function implementation from the C++ file"""
-        if not func_name:
-            return None
-        
-        class_name = self.spec.get('class_name', '')
-        
-        # Try class method first
-        pattern = rf'(?:void|bool|int|Result|[\w:]+)\s+{class_name}::{func_name}\s*\([^)]*\)\s*(?:override\s*)?\{{'
-        match = re.search(pattern, self.cpp_content, re.DOTALL)
-        
-        if match:
-            # Find matching closing brace
-            start = match.start()
-            brace_count = 0
-            in_string = False
-            escape_next = False
-            
-            for i, char in enumerate(self.cpp_content[start:], start):
-                if escape_next:
-                    escape_next = False
-                    continue
-                if char == '\\':
-                    escape_next = True
-                    continue
-                if char == '"' and not in_string:
-                    in_string = True
-                elif char == '"' and in_string:
-                    in_string = False
-                elif not in_string:
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            return self.cpp_content[start:i+1]
-        
-        return None
-    
-    def get_api_mappings_text(self) -> str:
-        """Generate human-readable API mappings"""
-        lines = []
-        
-        for section, mappings in self.mappings.items():
-            if section in ['test_structure']:
-                continue
-            
-            lines.append(f"\n### {section.replace('_', ' ').title()}")
-            
-            if isinstance(mappings, dict):
-                for name, value in mappings.items():
-                    if isinstance(value, dict):
-                        tserver = value.get('tserver', '')
-                        tng = value.get('tng', '')
-                        if tserver and tng:
-                            lines.append(f"- `{tserver}` → `{tng}`")
-        
-        return "\n".join(lines) if lines else "No specific mappings defined."
-    
-    def generate_context_file(self, output_file: str = None) -> str:
-        """
-        Generate a comprehensive context file for AI translation.
-        Includes TNG reference test if available.
-        """
-        test_name = self.spec.get('test_name', 'UnknownTest')
-        class_name = self.spec.get('class_name', test_name)
-        
-        content = []
-        
-        # Header
-        content.append(f"""# TServer to TNG Translation Context
+
+# Static markdown sections of the AI context, filled in with str.format_map
+_HEADER_TEMPLATE = """# TServer to TNG Translation Context
 
 ## Test Information
 
@@ -142,14 +39,12 @@ class AITranslator:
 |-------|-------|
 | **Test Name** | {test_name} |
 | **Class Name** | {class_name} |
-| **Suite** | {self.spec.get('suite_id', '')} |
-| **Description** | {self.spec.get('suite_description', '')} |
-| **Source File** | `{self.original_cpp}` |
-""")
+| **Suite** | {suite_id} |
+| **Description** | {suite_description} |
+| **Source File** | `{source_file}` |
+"""
 
-        # TNG Reference Section (if found)
-        if self.tng_reference_content:
-            content.append(f"""
+_TNG_REFERENCE_TEMPLATE = """
 ---
 
 ## ⭐ EXISTING TNG REFERENCE TEST
@@ -157,10 +52,10 @@ class AITranslator:
 **IMPORTANT**: An existing TNG test was found that corresponds to this TServer test.
 Use this as your PRIMARY reference for understanding TNG patterns and conventions.
 
-**TNG Reference File**: `{self.tng_reference_file}`
+**TNG Reference File**: `{reference_file}`
 
 ```cpp
-{self.tng_reference_content}
+{reference_content}
 ```
 
 ### Key Patterns to Follow from Reference:
@@ -173,9 +68,9 @@ Use this as your PRIMARY reference for understanding TNG patterns and convention
 6. **Device Access**: Use the same HAL patterns for hardware access
 
 ---
-""")
-        else:
-            content.append("""
+"""
+
+_NO_TNG_REFERENCE = """
 ---
 
 ## TNG Reference
@@ -185,53 +80,9 @@ Use this as your PRIMARY reference for understanding TNG patterns and convention
 > Refer to other TNG tests in your codebase for specific patterns.
 
 ---
-""")
-
-        # Parameters
-        content.append("""
-## Parameters
-""")
-        
-        params = self.spec.get('parameters', [])
-        if params:
-            content.append("| Name | Type | Default | Description |")
-            content.append("|------|------|---------|-------------|")
-            for param in params:
-                default = param.get('default', 'N/A')
-                desc = param.get('description', '')
-                content.append(f"| `{param.get('name')}` | {param.get('type')} | {default} | {desc} |")
-        else:
-            content.append("No parameters detected.")
-
-        # Variations
-        content.append("""
-
-## Test Variations
-""")
-        
-        variations = self.spec.get('variations', [])
-        if variations:
-            content.append("| ID | Name | Description |")
-            content.append("|----|------|-------------|")
-            for var in variations:
-                content.append(f"| {var.get('id')} | {var.get('name', '')} | {var.get('description', '')} |")
-        else:
-            content.append("No variations detected.")
-
-        # Original TServer Code
-        content.append(f"""
-
----
-
-## Original TServer Test Code
-
-```cpp
-{self.cpp_content}
-```
-""")
+"""
 
-        # API Mappings
-        content.append(f"""
+_TRANSLATION_GUIDE_TEMPLATE = """
 
 ---
 
@@ -250,7 +101,7 @@ Use this as your PRIMARY reference for understanding TNG patterns and convention
 | **Result Pass** | `return Pass;` | `return monitor;` |
 | **Result Fail** | `return Fail;` or `throw` | `monitor.fail("msg")` |
 
-{self.get_api_mappings_text()}
+{api_mappings}
 
 ---
 
@@ -343,14 +194,327 @@ int count = m_parameters.get<Count>();
 3. **Review the generated code** and integrate it into your TNG test
 4. **Test and iterate** - the AI provides a starting point, not final code
 
+"""
+
+
+class AITranslator:
+    """Generates AI context for TServer to TNG translation"""
+    
+    # Tokens relevant to brace matching. Whole string literals and escapes are
+    # consumed by the regex engine; a lone quote marks an unterminated string.
+    _TOKEN_RE = re.compile(rb'"(?:[^"\\]|\\.)*"|\\.|"|\{|\}', re.DOTALL)
+    
+    # Remainder of a member definition following "ClassName::"
+    _MEMBER_TAIL_RE = re.compile(rb'(\w+)\s*\([^)]*\)\s*(?:override\s*)?\{')
+    
+    def __init__(self, spec_file: str, original_cpp: str, mappings_file: str = None, 
+                 tng_path: str = None, tng_output_dir: str = None, tng_reference_file: str = None,
+                 spec: Dict = None):
+        """
+        Initialize the AI translator.
+        
+        Args:
+            spec_file: Path to the test specification YAML
+            original_cpp: Path to the original TServer .cpp file
+            mappings_file: Path to API mappings YAML
+            tng_path: Path to TNG source code (diag_tng)
+            tng_output_dir: Relative path within TNG for output
+            tng_reference_file: Path to existing TNG test file (for reference)
+            spec: Already-loaded specification; spec_file is not read if given
+        """
+        self.spec_file = spec_file
+        self.original_cpp = original_cpp
+        self.tng_path = tng_path
+        self.tng_output_dir = tng_output_dir
+        self.tng_reference_file = tng_reference_file
+        
+        # Load specification
+        self.spec = spec if spec is not None else load_yaml_cached(spec_file)
+        
+        self._class_name = self.spec.get('class_name', '')
+        self._func_index = None
+        self._extract_cache: Dict[str, Optional[str]] = {}
+        
+        # Load mappings
+        mappings_file = mappings_file or str(Path(__file__).parent / "api_mappings.yaml")
+        if os.path.exists(mappings_file):
+            self.mappings = load_yaml_cached(mappings_file)
+        else:
+            self.mappings = {}
+        self._api_mappings_text = None
+    
+    @classmethod
+    def from_spec(cls, spec, original_cpp: str, mappings_file: str = None,
+                  spec_file: str = None, **kwargs) -> 'AITranslator':
+        """
+        Create a translator from an in-memory specification.
+        
+        Args:
+            spec: TestSpecification or the equivalent dict
+            original_cpp: Path to the original TServer .cpp file
+            mappings_file: Path to API mappings YAML
+            spec_file: Path the specification was saved to (informational)
+            **kwargs: Remaining AITranslator arguments (tng_path, ...)
+        """
+        if is_dataclass(spec):
+            spec = asdict(spec)
+        return cls(spec_file, original_cpp, mappings_file, spec=spec, **kwargs)
+    
+    @cached_property
+    def cpp_bytes(self) -> bytes:
+        """Original C++ code as bytes with '\n' line endings, read on first access"""
+        data = Path(self.original_cpp).read_bytes()
+        if b'\r' in data:
+            # Same newline translation as a text-mode read, so offsets,
+            # line numbers and slices agree with the decoded text
+            data = data.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+        return data
+    
+    @cached_property
+    def cpp_content(self) -> str:
+        """Original C++ code, decoded only when text output needs it"""
+        return self.cpp_bytes.decode('utf-8')
+    
+    @cached_property
+    def tng_reference_content(self) -> Optional[str]:
+        """TNG reference test code, or None when no reference is available"""
+        if not self.tng_reference_file or not os.path.exists(self.tng_reference_file):
+            return None
+        return Path(self.tng_reference_file).read_text(encoding='utf-8')
+    
+    def _build_func_index(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Map each method name of the test class to the offsets of its definition.
+        
+        Definitions look like "<return type> ClassName::name(...) {"; candidates
+        are located with bytes.find on the "ClassName::" prefix. Each entry holds
+        the byte offsets of the return type and of the opening brace.
+        """
+        content = self.cpp_bytes
+        prefix = f"{self._class_name}::".encode('utf-8')
+        index = {}
+        
+        pos = content.find(prefix)
+        while pos != -1:
+            tail = self._MEMBER_TAIL_RE.match(content, pos + len(prefix))
+            
+            # Require whitespace, then a return type token, before the prefix
+            start = pos
+            while start > 0 and content[start - 1] in _SPACE_BYTES:
+                start -= 1
+            type_end = start
+            while start > 0 and content[start - 1] in _TYPE_TOKEN_BYTES:
+                start -= 1
+            
+            if tail and type_end < pos and start < type_end:
+                index.setdefault(tail.group(1).decode('ascii'), (start, tail.end() - 1))
+            # Resume right after the prefix: a tail can run past its own
+            # signature and over the start of the next definition
+            pos = content.find(prefix, pos + len(prefix))
+        
+        return index
+    
+    def extract_function(self, func_name: str) -> Optional[str]:
+        """Extract a function implementation from the C++ file"""
+        if not func_name:
+            return None
+        
+        if func_name in self._extract_cache:
+            return self._extract_cache[func_name]
+        
+        if self._func_index is None:
+            self._func_index = self._build_func_index()
+        
+        offsets = self._func_index.get(func_name)
+        body = self._scan_function_body(*offsets) if offsets else None
+        
+        self._extract_cache[func_name] = body
+        return body
+    
+    def _scan_function_body(self, start: int, body_start: int) -> Optional[str]:
+        """Return the definition from start up to the brace matching body_start"""
+        brace_count = 0
+        
+        # Visit only brace/quote/escape tokens, beginning at the opening brace
+        for token in self._TOKEN_RE.finditer(self.cpp_bytes, body_start):
+            char = token.group()
+            if char == b'"':
+                # Unterminated string literal swallows the rest of the file
+                break
+            elif char == b'{':
+                brace_count += 1
+            elif char == b'}':
+                brace_count -= 1
+                if brace_count == 0:
+                    return self.cpp_bytes[start:token.end()].decode('utf-8')
+        
+        return None
+    
+    def get_api_mappings_text(self) -> str:
+        """Generate human-readable API mappings (rendered once per instance)"""
+        if self._api_mappings_text is None:
+            self._api_mappings_text = self._compute_api_mappings_text()
+        return self._api_mappings_text
+    
+    def _compute_api_mappings_text(self) -> str:
+        """Render the API mappings as markdown"""
+        lines = []
+        
+        for section, mappings in self.mappings.items():
+            if section in ['test_structure']:
+                continue
+            
+            lines.append(f"\n### {section.replace('_', ' ').title()}")
+            
+            if isinstance(mappings, dict):
+                lines.extend(
+                    f"- `{value['tserver']}` → `{value['tng']}`"
+                    for value in mappings.values()
+                    if isinstance(value, dict) and value.get('tserver') and value.get('tng')
+                )
+        
+        return "\n".join(lines) if lines else "No specific mappings defined."
+    
+    def _source_line_ranges(self, variations: List[Dict]) -> str:
+        """Render a table locating each variation's function in the source file"""
+        if self._func_index is None:
+            self._func_index = self._build_func_index()
+        
+        rows = []
+        for var in variations:
+            func_name = var.get('function_name', '')
+            offsets = self._func_index.get(func_name) if func_name else None
+            if not offsets:
+                continue
+            body = self.extract_function(func_name)
+            first = self.cpp_bytes.count(b'\n', 0, offsets[0]) + 1
+            # Without an extracted body the end line is unknown
+            last = first + body.count('\n') if body is not None else '?'
+            rows.append(f"| {var.get('id')} | `{func_name}` | {first}-{last} |")
+        
+        if not rows:
+            return ""
+        return "\n".join(["| Variation | Function | Lines |", "|-----------|----------|-------|"] + rows)
+    
+    def _write_if_changed(self, output_file: str, text: str) -> bool:
+        """Write text to output_file unless it already holds identical content"""
+        data = text.encode('utf-8')
+        try:
+            with open(output_file, 'rb') as f:
+                if f.read() == data:
+                    return False
+        except FileNotFoundError:
+            pass
+        
+        with open(output_file, 'wb', buffering=1 << 16) as f:
+            f.write(data)
+        return True
+    
+    def generate_context_file(self, output_file: str = None, embed_source: bool = True) -> str:
+        """
+        Generate a comprehensive context file for AI translation.
+        Includes TNG reference test if available.
+        
+        Args:
+            output_file: Optional path to write the context to
+            embed_source: Inline the original TServer code; when False, only
+                reference the source file and the line ranges of each variation
+        """
+        test_name = self.spec.get('test_name', 'UnknownTest')
+        class_name = self.spec.get('class_name', test_name)
+        
+        buf = io.StringIO()
+        
+        def emit(text: str):
+            # Pieces are newline-separated, matching a "\n".join of the parts
+            if buf.tell():
+                buf.write("\n")
+            buf.write(text)
+        
+        # Header
+        emit(_HEADER_TEMPLATE.format_map({
+            'test_name': test_name,
+            'class_name': class_name,
+            'suite_id': self.spec.get('suite_id', ''),
+            'suite_description': self.spec.get('suite_description', ''),
+            'source_file': self.original_cpp,
+        }))
+
+        # TNG Reference Section (if found)
+        if self.tng_reference_content:
+            emit(_TNG_REFERENCE_TEMPLATE.format_map({
+                'reference_file': self.tng_reference_file,
+                'reference_content': self.tng_reference_content,
+            }))
+        else:
+            emit(_NO_TNG_REFERENCE)
+
+        # Parameters
+        emit("""
+## Parameters
 """)
+        
+        params = self.spec.get('parameters', [])
+        if params:
+            emit("| Name | Type | Default | Description |")
+            emit("|------|------|---------|-------------|")
+            emit("\n".join(
+                f"| `{param.get('name')}` | {param.get('type')} | {param.get('default', 'N/A')} | {param.get('description', '')} |"
+                for param in params
+            ))
+        else:
+            emit("No parameters detected.")
 
-        result = "\n".join(content)
+        # Variations
+        emit("""
+
+## Test Variations
+""")
+        
+        variations = self.spec.get('variations', [])
+        if variations:
+            emit("| ID | Name | Description |")
+            emit("|----|------|-------------|")
+            emit("\n".join(
+                f"| {var.get('id')} | {var.get('name', '')} | {var.get('description', '')} |"
+                for var in variations
+            ))
+        else:
+            emit("No variations detected.")
+
+        # Original TServer Code
+        if embed_source:
+            emit(f"""
+
+---
+
+## Original TServer Test Code
+
+```cpp
+{self.cpp_content}
+```
+""")
+        else:
+            emit(f"""
+
+---
+
+## Original TServer Test Code
+
+See `{self.original_cpp}`.
+""")
+            emit(self._source_line_ranges(variations))
+
+        # API Mappings and translation instructions
+        emit(_TRANSLATION_GUIDE_TEMPLATE.format_map({'api_mappings': self.get_api_mappings_text()}))
+
+        result = buf.getvalue()
         
         if output_file:
-            with open(output_file, 'w') as f:
-                f.write(result)
-            print(f"Context file saved: {output_file}")
+            if self._write_if_changed(output_file, result):
+                print(f"Context file saved: {output_file}")
+            else:
+                print(f"Context file unchanged: {output_file}")
         
         return result
 
@@ -363,7 +527,9 @@ def main():
     parser.add_argument('spec_file', help='Path to test specification YAML')
     parser.add_argument('cpp_file', help='Path to original TServer .cpp file')
     parser.add_argument('--tng-reference', '-r', help='Path to existing TNG reference test')
-    parser.add_argument('--output', '-o', help='Output context file')
+    parser.add_argument('--output', '-o', help="Output context file ('-' for stdout)")
+    parser.add_argument('--no-embed-source', action='store_true',
+                        help='Reference the original source by path instead of inlining it')
     
     args = parser.parse_args()
     
@@ -373,8 +539,17 @@ def main():
         tng_reference_file=args.tng_reference
     )
     
+    embed_source = not args.no_embed_source
+    
+    if args.output == '-':
+        # Emit the whole context in one write rather than through print()
+        sys.stdout.write(translator.generate_context_file(embed_source=embed_source))
+        sys.stdout.write("\n")
+        sys.stdout.flush()
+        return
+    
     output = args.output or args.spec_file.replace('.yaml', '_ai_context.md')
-    translator.generate_context_file(output)
+    translator.generate_context_file(output, embed_source=embed_source)
 
 
 if __name__ == '__main__':
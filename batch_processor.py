@@ -10,21 +10,47 @@ Usage:
     python batch_processor.py --list /path/to/suite/gpu
 """
 
+import io
 import os
+import re
 import sys
 import json
+import mmap
 import glob
+import time
+import fnmatch
 import argparse
+import itertools
 from pathlib import Path
-from typing import List, Dict, Tuple, Optional
-from dataclasses import dataclass, asdict
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Tuple, Optional, Iterator
+from dataclasses import dataclass, field, asdict
+from functools import cached_property
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, FIRST_COMPLETED, wait
 
-from spec_extractor import TServerExtractor
+# orjson is optional; the standard library encoder is used without it
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from spec_extractor import TServerExtractor, TestSpecification
+from spec_cache import get_or_extract
 from tng_generator import TNGGenerator
 from ai_translator import AITranslator
 
 
+# Page-cache hints are only available on POSIX platforms
+_HAS_FADVISE = hasattr(os, 'posix_fadvise')
+
+
+def _stem(path: str) -> str:
+    """File name without its final suffix (Path.stem without building a Path)"""
+    name = path[path.rfind(os.sep) + 1:]
+    dot = name.rfind('.')
+    return name[:dot] if dot > 0 else name
+
+
 @dataclass
 class TestInfo:
     """Information about a discovered test"""
@@ -38,6 +64,12 @@ class TestInfo:
     has_tcore: bool
     has_register_access: bool
     has_memory_ops: bool
+    spec_cache: Optional[TestSpecification] = field(default=None, repr=False)
+    
+    @cached_property
+    def suite_name_lower(self) -> str:
+        """Lowercased suite name, computed once for repeated filtering"""
+        return self.suite_name.lower()
 
 
 @dataclass
@@ -51,97 +83,264 @@ class TranslationResult:
     error: Optional[str] = None
 
 
+class _ProgressWriter:
+    """Buffers progress lines and writes them to stdout at a bounded rate"""
+    
+    def __init__(self, interval: float = 0.05):
+        self.interval = interval
+        self._lines: List[str] = []
+        self._last_flush = time.monotonic()
+    
+    def write(self, line: str):
+        self._lines.append(line)
+        if time.monotonic() - self._last_flush >= self.interval:
+            self.flush()
+    
+    def flush(self):
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+            self._lines.clear()
+        self._last_flush = time.monotonic()
+
+
+# Features column text indexed by tcore | register << 1 | memory << 2
+_FEATURE_LABELS = (
+    "", "TCore", "Reg", "TCore, Reg",
+    "Mem", "TCore, Mem", "Reg, Mem", "TCore, Reg, Mem",
+)
+
+
 class BatchProcessor:
     """Batch processor for TServer tests"""
     
+    # Markers identifying a TServer test file
+    _TSERVER_MARKER_RE = re.compile(rb'ts::Test|TServerTestInstance')
+    
+    # Weaker hints that a file whose head lacks the markers may still be a test
+    _TSERVER_HINT_RE = re.compile(rb'ts::|ts_test|TServer')
+    
+    # Bytes inspected before deciding whether a full-file scan is needed
+    _PROBE_SIZE = 16384
+    
+    # API markers reported in TestInfo, collected in a single scan
+    _API_MARKER_RE = re.compile(rb'TcoreInterface|TCORE_NAME|RegRead|RegWrite|palloc|pfree')
+    
     def __init__(self, output_dir: str = "tng_output"):
         """
         Initialize the batch processor.
         
+        The output directory is created on first write, so discovery-only
+        use (e.g. listing tests) leaves the filesystem untouched.
+        
         Args:
             output_dir: Directory for output files
         """
         self.output_dir = output_dir
-        os.makedirs(output_dir, exist_ok=True)
     
-    def discover_tests(self, search_dir: str, pattern: str = "*.cpp") -> List[TestInfo]:
+    def _ensure_output_dir(self):
+        """Create the output directory if it does not exist yet"""
+        os.makedirs(self.output_dir, exist_ok=True)
+    
+    def discover_tests(self, search_dir: str, pattern: str = "*.cpp",
+                       max_workers: int = None,
+                       file_stats: list = None) -> List[TestInfo]:
         """
         Discover TServer tests in a directory.
         
+        The directory walk runs in the calling thread and feeds candidate
+        files to a thread pool that reads and analyzes them, keeping a
+        bounded number in flight. Results keep the walk order.
+        
         Args:
             search_dir: Directory to search
             pattern: Glob pattern for test files
+            max_workers: Analysis threads (default: os.cpu_count())
+            file_stats: Optional list that receives (path, mtime_ns, size)
+                for every file under search_dir, in walk order
             
         Returns:
             List of TestInfo objects
         """
         tests = []
+        xml_index: Dict[str, Optional[str]] = {}
+        max_workers = max_workers or os.cpu_count() or 1
+        max_pending = max_workers * 4
+        pending = deque()
         
-        # Find all cpp files
-        search_path = Path(search_dir)
-        cpp_files = list(search_path.rglob(pattern))
-        
-        for cpp_file in cpp_files:
-            # Check if it's a TServer test
-            if self._is_tserver_test(str(cpp_file)):
-                test_info = self._analyze_test(str(cpp_file))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            # Find all cpp files
+            for cpp_file in self._walk_files(str(Path(search_dir)), pattern,
+                                            xml_index, file_stats):
+                pending.append(executor.submit(self._discover_file, cpp_file, xml_index))
+                if len(pending) >= max_pending:
+                    test_info = pending.popleft().result()
+                    if test_info:
+                        tests.append(test_info)
+            
+            while pending:
+                test_info = pending.popleft().result()
                 if test_info:
                     tests.append(test_info)
         
         return tests
     
-    def _is_tserver_test(self, cpp_file: str) -> bool:
-        """Check if a file is a TServer test"""
+    def _discover_file(self, cpp_file: str,
+                       xml_index: Dict[str, Optional[str]]) -> Optional[TestInfo]:
+        """Probe a candidate file via mmap and fully read it only if it is a TServer test"""
+        try:
+            with open(cpp_file, 'rb') as f:
+                if _HAS_FADVISE:
+                    os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+                try:
+                    mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+                except ValueError:
+                    # Empty files cannot be mapped and are never tests
+                    return None
+                with mm:
+                    # Check if it's a TServer test
+                    if not self._is_tserver_test(cpp_file, mm):
+                        # Read once and never again: keep it out of the page cache.
+                        # Tests are re-read during translation, so they stay cached.
+                        if _HAS_FADVISE:
+                            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+                        return None
+                    content = mm[:]
+        except OSError:
+            return None
+        
+        return self._analyze_test(cpp_file, content, xml_index)
+    
+    def _walk_files(self, root: str, pattern: str,
+                    xml_index: Dict[str, Optional[str]] = None,
+                    file_stats: list = None):
+        """
+        Yield paths of files under root whose name matches pattern.
+        
+        Directories are visited depth-first, parents before children, using
+        os.scandir so entry types come from the directory listing itself.
+        When xml_index is given, each visited directory's first XML file is
+        recorded in it before any of that directory's files are yielded.
+        When file_stats is given, (path, mtime_ns, size) of every file seen
+        is appended to it.
+        """
+        stack = [root]
+        while stack:
+            directory = stack.pop()
+            subdirs = []
+            matches = []
+            xml_file = None
+            try:
+                with os.scandir(directory) as entries:
+                    for entry in entries:
+                        name = entry.name
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        else:
+                            if file_stats is not None:
+                                try:
+                                    st = entry.stat()
+                                    file_stats.append((entry.path, st.st_mtime_ns, st.st_size))
+                                except OSError:
+                                    pass  # Dangling symlink or entry removed meanwhile
+                            if fnmatch.fnmatchcase(name, pattern) and entry.is_file():
+                                matches.append(entry.path)
+                        if xml_file is None and name.endswith('.xml') and not name.startswith('.'):
+                            xml_file = entry.path
+            except OSError:
+                continue
+            
+            if xml_index is not None:
+                xml_index[directory] = xml_file
+            yield from matches
+            stack.extend(reversed(subdirs))
+    
+    def _is_tserver_test(self, cpp_file: str, content=None) -> bool:
+        """
+        Check if a file is a TServer test.
+        
+        content may be bytes or an mmap (a regex search works on either).
+        """
         try:
-            with open(cpp_file, 'r') as f:
-                content = f.read()
-                # Check for TServer markers
-                return (
-                    'ts::Test' in content or
-                    'TServerTestInstance' in content or
-                    'ts::TestFactory' in content
-                )
+            if content is None:
+                with open(cpp_file, 'rb') as f:
+                    content = f.read()
+            # Check for TServer markers (ts::Test also covers ts::TestFactory),
+            # looking at the head first and scanning the rest only when hinted
+            head = self._PROBE_SIZE
+            if self._TSERVER_MARKER_RE.search(content, 0, head):
+                return True
+            if len(content) <= head or not self._TSERVER_HINT_RE.search(content, 0, head):
+                return False
+            return self._TSERVER_MARKER_RE.search(content, head - 32) is not None
         except Exception:
             return False
     
-    def _analyze_test(self, cpp_file: str) -> Optional[TestInfo]:
-        """Analyze a TServer test file"""
+    def _first_xml(self, directory: str) -> Optional[str]:
+        """Return the first (non-hidden) XML file in directory, if any"""
+        try:
+            with os.scandir(directory or '.') as entries:
+                for entry in entries:
+                    if entry.name.endswith('.xml') and not entry.name.startswith('.'):
+                        return os.path.join(directory, entry.name)
+        except OSError:
+            pass
+        return None
+    
+    def _analyze_test(self, cpp_file: str, content: bytes = None,
+                      xml_index: Dict[str, Optional[str]] = None) -> Optional[TestInfo]:
+        """
+        Analyze a TServer test file.
+        
+        Args:
+            cpp_file: Path to TServer .cpp file
+            content: Raw file contents, if already read
+            xml_index: Directory -> XML file cache shared across a discovery run
+        """
         try:
-            # Find corresponding XML
-            cpp_path = Path(cpp_file)
-            xml_files = list(cpp_path.parent.glob("*.xml"))
-            xml_file = str(xml_files[0]) if xml_files else None
+            if content is None:
+                with open(cpp_file, 'rb') as f:
+                    content = f.read()
             
-            # Extract basic info
-            extractor = TServerExtractor(cpp_file, xml_file)
-            spec = extractor.extract()
+            # Find corresponding XML, scanning each directory only once
+            parent = os.path.dirname(cpp_file)
+            if xml_index is not None and parent in xml_index:
+                xml_file = xml_index[parent]
+            else:
+                xml_file = self._first_xml(parent)
+                if xml_index is not None:
+                    xml_index[parent] = xml_file
             
-            # Check for specific APIs
-            with open(cpp_file, 'r') as f:
-                content = f.read()
+            # Extract basic info (served from the persistent cache when unchanged)
+            spec = get_or_extract(cpp_file, xml_file, content)
             
-            has_tcore = 'TcoreInterface' in content or 'TCORE_NAME' in content
-            has_register = 'RegRead' in content or 'RegWrite' in content
-            has_memory = 'palloc' in content or 'pfree' in content
+            # Check for specific APIs
+            hits = set(self._API_MARKER_RE.findall(content))
+            has_tcore = b'TcoreInterface' in hits or b'TCORE_NAME' in hits
+            has_register = b'RegRead' in hits or b'RegWrite' in hits
+            has_memory = b'palloc' in hits or b'pfree' in hits
             
             return TestInfo(
                 cpp_file=cpp_file,
                 xml_file=xml_file,
-                suite_name=spec.suite_id,
-                test_name=spec.test_name or cpp_path.stem,
+                suite_name=sys.intern(spec.suite_id),
+                test_name=spec.test_name or _stem(cpp_file),
                 class_name=spec.class_name,
                 num_variations=len(spec.variations),
                 num_parameters=len(spec.parameters),
                 has_tcore=has_tcore,
                 has_register_access=has_register,
-                has_memory_ops=has_memory
+                has_memory_ops=has_memory,
+                spec_cache=spec
             )
         except Exception as e:
             print(f"Warning: Could not analyze {cpp_file}: {e}")
             return None
     
     def translate_test(self, cpp_file: str, xml_file: str = None,
-                       generate_context: bool = True) -> TranslationResult:
+                       generate_context: bool = True,
+                       spec: TestSpecification = None,
+                       create_dir: bool = True) -> TranslationResult:
         """
         Translate a single TServer test to TNG.
         
@@ -149,34 +348,40 @@ class BatchProcessor:
             cpp_file: Path to TServer .cpp file
             xml_file: Path to TServer .xml file (optional)
             generate_context: Whether to generate AI context file
+            spec: Specification already extracted during discovery (optional)
+            create_dir: Create the output subdirectory (False if already done)
             
         Returns:
             TranslationResult object
         """
         try:
-            cpp_path = Path(cpp_file)
-            base_name = cpp_path.stem
+            base_name = _stem(cpp_file)
             
             # Create output subdirectory
             output_subdir = os.path.join(self.output_dir, base_name)
-            os.makedirs(output_subdir, exist_ok=True)
+            if create_dir:
+                os.makedirs(output_subdir, exist_ok=True)
             
-            # Step 1: Extract specification
+            # Step 1: Extract specification (reuse the discovery result if given)
             extractor = TServerExtractor(cpp_file, xml_file)
-            spec = extractor.extract()
+            if spec is None:
+                spec = extractor.extract()
+            else:
+                extractor.spec = spec
             
             spec_file = os.path.join(output_subdir, f"{base_name}_spec.yaml")
             extractor.save_spec(spec_file)
             
-            # Step 2: Generate TNG code
-            generator = TNGGenerator(spec_file)
+            # Step 2: Generate TNG code from the in-memory spec
+            spec_data = asdict(spec)  # shared by the generator and the translator
+            generator = TNGGenerator.from_spec(spec_data, spec_file=spec_file)
             tng_file = os.path.join(output_subdir, f"{base_name}_tng_test.cpp")
             generator.generate(tng_file)
             
             # Step 3: Generate AI context (optional)
             context_file = None
             if generate_context:
-                translator = AITranslator(spec_file, cpp_file)
+                translator = AITranslator.from_spec(spec_data, cpp_file, spec_file=spec_file)
                 context_file = os.path.join(output_subdir, f"{base_name}_ai_context.md")
                 translator.generate_context_file(context_file)
             
@@ -197,7 +402,9 @@ class BatchProcessor:
     
     def translate_batch(self, tests: List[TestInfo], 
                         max_workers: int = 4,
-                        generate_context: bool = True) -> List[TranslationResult]:
+                        generate_context: bool = True,
+                        use_processes: bool = True,
+                        verbose: bool = True) -> List[TranslationResult]:
         """
         Translate multiple tests in parallel.
         
@@ -205,99 +412,173 @@ class BatchProcessor:
             tests: List of TestInfo objects
             max_workers: Maximum parallel workers
             generate_context: Whether to generate AI context files
+            use_processes: Use a process pool (False selects a thread pool)
+            verbose: Print a status line as each test completes
             
         Returns:
-            List of TranslationResult objects
+            List of TranslationResult objects, in completion order
         """
         results = []
+        progress = _ProgressWriter()
         
-        with ThreadPoolExecutor(max_workers=max_workers) as executor:
-            futures = {
-                executor.submit(
-                    self.translate_test,
-                    test.cpp_file,
-                    test.xml_file,
-                    generate_context
-                ): test for test in tests
-            }
-            
-            for future in as_completed(futures):
-                test = futures[future]
-                try:
-                    result = future.result()
-                    results.append(result)
-                    status = "✓" if result.success else "✗"
-                    print(f"  {status} {test.test_name}")
-                except Exception as e:
-                    results.append(TranslationResult(
-                        cpp_file=test.cpp_file,
-                        success=False,
-                        error=str(e)
-                    ))
-                    print(f"  ✗ {test.test_name}: {e}")
+        for test, result in self.translate_batch_iter(tests, max_workers,
+                                                      generate_context, use_processes):
+            results.append(result)
+            if verbose:
+                status = "✓" if result.success else "✗"
+                progress.write(f"  {status} {test.test_name}")
         
+        progress.flush()
         return results
     
+    def translate_batch_iter(self, tests: List[TestInfo],
+                             max_workers: int = 4,
+                             generate_context: bool = True,
+                             use_processes: bool = True) -> Iterator[Tuple[TestInfo, TranslationResult]]:
+        """
+        Translate multiple tests in parallel, yielding each result as it completes.
+        
+        Translation is CPU-bound Python, so by default each test runs in a
+        separate process to avoid serializing on the GIL.
+        
+        Args:
+            tests: List of TestInfo objects
+            max_workers: Maximum parallel workers
+            generate_context: Whether to generate AI context files
+            use_processes: Use a process pool (False selects a thread pool)
+            
+        Yields:
+            (TestInfo, TranslationResult) pairs in completion order
+        """
+        # A pool costs more than it saves for a single test or worker
+        if len(tests) <= 1 or max_workers <= 1:
+            for test in tests:
+                yield test, self.translate_test(test.cpp_file, test.xml_file,
+                                                generate_context, test.spec_cache)
+            return
+        
+        executor_class = ProcessPoolExecutor if use_processes else ThreadPoolExecutor
+        
+        # Create every output subdirectory up front, off the workers' path
+        for subdir in sorted({_stem(test.cpp_file) for test in tests}):
+            os.makedirs(os.path.join(self.output_dir, subdir), exist_ok=True)
+        
+        with executor_class(max_workers=max_workers) as executor:
+            # Keep only a bounded number of translations in flight
+            tests_iter = iter(tests)
+            futures = {}
+            
+            def submit_next(count: int):
+                for test in itertools.islice(tests_iter, count):
+                    future = executor.submit(
+                        self.translate_test,
+                        test.cpp_file,
+                        test.xml_file,
+                        generate_context,
+                        test.spec_cache,
+                        create_dir=False
+                    )
+                    futures[future] = test
+            
+            submit_next(max_workers * 2)
+            
+            while futures:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                submit_next(len(done))
+                for future in done:
+                    test = futures.pop(future)
+                    try:
+                        result = future.result()
+                    except Exception as e:
+                        result = TranslationResult(
+                            cpp_file=test.cpp_file,
+                            success=False,
+                            error=str(e)
+                        )
+                    yield test, result
+    
     def generate_report(self, tests: List[TestInfo], 
                         results: List[TranslationResult],
                         output_file: str = None) -> str:
         """Generate a summary report"""
-        output_file = output_file or os.path.join(self.output_dir, "translation_report.md")
+        if output_file is None:
+            self._ensure_output_dir()
+            output_file = os.path.join(self.output_dir, "translation_report.md")
         
         successful = [r for r in results if r.success]
         failed = [r for r in results if not r.success]
         
-        report = []
-        report.append("# TServer to TNG Translation Report\n")
-        report.append(f"## Summary\n")
-        report.append(f"- **Total Tests**: {len(tests)}")
-        report.append(f"- **Successful**: {len(successful)}")
-        report.append(f"- **Failed**: {len(failed)}")
-        report.append(f"- **Output Directory**: `{self.output_dir}`\n")
+        report = io.StringIO()
+        write = report.write
+        write("# TServer to TNG Translation Report\n\n")
+        write("## Summary\n\n")
+        write(f"- **Total Tests**: {len(tests)}\n")
+        write(f"- **Successful**: {len(successful)}\n")
+        write(f"- **Failed**: {len(failed)}\n")
+        write(f"- **Output Directory**: `{self.output_dir}`\n\n")
         
         # Test breakdown by features
-        report.append("## Test Analysis\n")
-        report.append("| Test | Suite | Variations | TCore | RegAccess | Memory |")
-        report.append("|------|-------|------------|-------|-----------|--------|")
+        write("## Test Analysis\n\n")
+        write("| Test | Suite | Variations | TCore | RegAccess | Memory |\n")
+        write("|------|-------|------------|-------|-----------|--------|\n")
         
-        for test in tests:
-            tcore = "✓" if test.has_tcore else ""
-            reg = "✓" if test.has_register_access else ""
-            mem = "✓" if test.has_memory_ops else ""
-            report.append(f"| {test.test_name} | {test.suite_name} | {test.num_variations} | {tcore} | {reg} | {mem} |")
+        check = {True: "✓", False: ""}
+        write("".join(
+            f"| {test.test_name} | {test.suite_name} | {test.num_variations} | "
+            f"{check[test.has_tcore]} | {check[test.has_register_access]} | {check[test.has_memory_ops]} |\n"
+            for test in tests
+        ))
         
-        report.append("\n## Translation Results\n")
+        write("\n## Translation Results\n\n")
         
         if successful:
-            report.append("### Successful Translations\n")
+            write("### Successful Translations\n\n")
             for result in successful:
-                name = Path(result.cpp_file).stem
-                report.append(f"- **{name}**")
-                report.append(f"  - Spec: `{result.spec_file}`")
-                report.append(f"  - TNG: `{result.tng_file}`")
+                name = _stem(result.cpp_file)
+                write(f"- **{name}**\n  - Spec: `{result.spec_file}`\n  - TNG: `{result.tng_file}`\n")
                 if result.context_file:
-                    report.append(f"  - AI Context: `{result.context_file}`")
+                    write(f"  - AI Context: `{result.context_file}`\n")
         
         if failed:
-            report.append("\n### Failed Translations\n")
+            write("\n### Failed Translations\n\n")
             for result in failed:
-                name = Path(result.cpp_file).stem
-                report.append(f"- **{name}**: {result.error}")
+                name = _stem(result.cpp_file)
+                write(f"- **{name}**: {result.error}\n")
         
-        report.append("\n## Next Steps\n")
-        report.append("1. Review generated specifications (`.yaml` files)")
-        report.append("2. Edit feature/sub_characteristic in specs")
-        report.append("3. Use AI context files (`.md`) with Claude/GPT for implementation help")
-        report.append("4. Implement TODO sections in generated TNG tests")
-        report.append("5. Add tests to TNG CMakeLists.txt")
+        write("\n## Next Steps\n\n")
+        write("1. Review generated specifications (`.yaml` files)\n")
+        write("2. Edit feature/sub_characteristic in specs\n")
+        write("3. Use AI context files (`.md`) with Claude/GPT for implementation help\n")
+        write("4. Implement TODO sections in generated TNG tests\n")
+        write("5. Add tests to TNG CMakeLists.txt")
         
-        report_text = "\n".join(report)
+        report_text = report.getvalue()
         
         with open(output_file, 'w') as f:
             f.write(report_text)
         
         print(f"\nReport saved: {output_file}")
         return report_text
+    
+    def generate_json_report(self, results: List[TranslationResult],
+                             output_file: str = None) -> str:
+        """Write translation results as machine-readable JSON"""
+        if output_file is None:
+            self._ensure_output_dir()
+            output_file = os.path.join(self.output_dir, "translation_report.json")
+        
+        # TranslationResult holds only scalars, so vars() avoids asdict's deep copy
+        records = [vars(result) for result in results]
+        if orjson is not None:
+            data = orjson.dumps(records, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(records, indent=2).encode('utf-8')
+        
+        with open(output_file, 'wb') as f:
+            f.write(data)
+        
+        print(f"JSON report saved: {output_file}")
+        return output_file
 
 
 def main():
@@ -311,7 +592,13 @@ def main():
     parser.add_argument('--pattern', '-p', default='*.cpp', help='File pattern to match')
     parser.add_argument('--no-context', action='store_true', help='Skip AI context generation')
     parser.add_argument('--workers', '-w', type=int, default=4, help='Parallel workers')
+    parser.add_argument('--io-bound', action='store_true',
+                        help='Use worker threads instead of processes for translation')
     parser.add_argument('--suite', '-s', help='Filter by suite name')
+    parser.add_argument('--json-report', action='store_true',
+                        help='Also write translation results as JSON')
+    parser.add_argument('--quiet', '-q', action='store_true',
+                        help='Suppress per-test progress lines')
     
     args = parser.parse_args()
     
@@ -342,7 +629,8 @@ def main():
     
     # Filter by suite if specified
     if args.suite:
-        tests = [t for t in tests if args.suite.lower() in t.suite_name.lower()]
+        needle = args.suite.lower()
+        tests = [t for t in tests if needle in t.suite_name_lower]
     
     print(f"Found {len(tests)} TServer tests\n")
     
@@ -354,31 +642,36 @@ def main():
         print("-" * 80)
         
         for test in tests:
-            features = []
-            if test.has_tcore:
-                features.append("TCore")
-            if test.has_register_access:
-                features.append("Reg")
-            if test.has_memory_ops:
-                features.append("Mem")
-            
-            print(f"{test.test_name:<30} {test.suite_name:<10} {test.num_variations:<6} {test.num_parameters:<8} {', '.join(features)}")
+            features = _FEATURE_LABELS[test.has_tcore | (test.has_register_access << 1) | (test.has_memory_ops << 2)]
+            print(f"{test.test_name:<30} {test.suite_name:<10} {test.num_variations:<6} {test.num_parameters:<8} {features}")
         
         return
     
-    # Translation mode
+    # Translation mode: report progress and count successes as results arrive
     print("Translating tests...")
-    results = processor.translate_batch(
+    results = []
+    successful = 0
+    progress = _ProgressWriter()
+    
+    for test, result in processor.translate_batch_iter(
         tests,
         max_workers=args.workers,
-        generate_context=not args.no_context
-    )
+        generate_context=not args.no_context,
+        use_processes=not args.io_bound
+    ):
+        results.append(result)
+        successful += result.success
+        if not args.quiet:
+            progress.write(f"  {'✓' if result.success else '✗'} {test.test_name}")
+    
+    progress.flush()
     
     # Generate report
     processor.generate_report(tests, results)
+    if args.json_report:
+        processor.generate_json_report(results)
     
     # Summary
-    successful = sum(1 for r in results if r.success)
     print(f"\n{'='*60}")
     print(f"Completed: {successful}/{len(tests)} tests translated successfully")
     print(f"{'='*60}")
@@ -28,34 +28,64 @@ Examples:
 """
 
 import argparse
+import functools
 import os
 import sys
-import yaml
-import glob
-from pathlib import Path
-
-from spec_extractor import TServerExtractor
-from tng_generator import TNGGenerator
-from ai_translator import AITranslator
-from batch_processor import BatchProcessor
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 
 __version__ = "2.0.0"
 
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), "config.yaml")
 
+# Horizontal rule used by the section banners
+_BAR = "=" * 60
+
+
+def _banner(title: str):
+    """Print a section title between two horizontal rules in one write"""
+    sys.stdout.write(f"\n{_BAR}\n{title}\n{_BAR}\n")
+
+
+@functools.lru_cache(maxsize=1)
+def _load_config_cached(path: str, mtime_ns: int, size: int):
+    """Parse the config file; mtime_ns and size only key the cache"""
+    # Read raw bytes in one call; the YAML reader handles the decoding
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        data = os.read(fd, os.fstat(fd).st_size)
+    finally:
+        os.close(fd)
+    # Imported here so commands that never read the config skip PyYAML;
+    # LibYAML-backed loader when available, pure-Python SafeLoader otherwise
+    import yaml
+    return yaml.load(data, Loader=getattr(yaml, 'CSafeLoader', yaml.SafeLoader))
+
 
 def load_config():
-    """Load configuration from config.yaml"""
-    if os.path.exists(CONFIG_FILE):
-        with open(CONFIG_FILE, 'r') as f:
-            return yaml.safe_load(f)
-    return {}
+    """
+    Load configuration from config.yaml.
+    
+    The parsed result is reused until the file's mtime or size changes
+    (load_config.cache_clear() drops it). Callers must treat the returned
+    dict as read-only.
+    """
+    try:
+        st = os.stat(CONFIG_FILE)
+    except OSError:
+        return {}
+    return _load_config_cached(CONFIG_FILE, st.st_mtime_ns, st.st_size)
 
 
-def get_ip_config(ip_name: str):
-    """Get configuration for a specific IP block"""
-    config = load_config()
+load_config.cache_clear = _load_config_cached.cache_clear
+
+
+def get_ip_config(ip_name: str, config: dict = None):
+    """Get configuration for a specific IP block (optionally from a loaded config)"""
+    if config is None:
+        config = load_config()
     ips = config.get('ip_blocks', {})
     return ips.get(ip_name.lower())
 
@@ -74,53 +104,305 @@ def find_tng_reference(tserver_cpp: str, tng_base: str) -> str:
     if not tng_base or not os.path.exists(tng_base):
         return None
     
+    # Split the TServer path once into directory and file name
+    tserver_dir, _, tserver_name = tserver_cpp.rpartition(os.sep)
+    tserver_dir = tserver_dir.rstrip(os.sep)
+    
     # Extract test name from TServer path
-    tserver_name = os.path.basename(tserver_cpp)
     test_base_name = tserver_name.replace('_test.cpp', '').replace('.cpp', '')
     
     # Extract suite name (e.g., 'mpc' from suite/gpu/mpc/)
-    tserver_dir = os.path.dirname(tserver_cpp)
-    suite_name = os.path.basename(tserver_dir)
+    suite_name = tserver_dir[tserver_dir.rfind(os.sep) + 1:]
+    
+    # Search candidates (ordered by likelihood). The engine/*/test patterns
+    # only list the directories on their literal path; the recursive
+    # searches are a fallback for when none of them match.
+    test_dirs = [os.path.join(d, "test") for d in _subdirs(os.path.join(tng_base, "engine"))]
+    test_dirs = [d for d in test_dirs if os.path.isdir(d)]
     
-    # Search patterns (ordered by likelihood)
-    search_patterns = [
+    def engine_candidates():
         # Exact match in stimulus folder
-        f"engine/*/test/stimulus/{suite_name}/{test_base_name}*.cpp",
-        f"engine/*/test/stimulus/*/{test_base_name}*.cpp",
+        yield (m for d in test_dirs
+               for m in _cpp_files_with_prefix(os.path.join(d, "stimulus", suite_name), test_base_name))
+        yield (m for d in test_dirs for sub in _subdirs(os.path.join(d, "stimulus"))
+               for m in _cpp_files_with_prefix(sub, test_base_name))
         # Direct test folder
-        f"engine/*/test/{suite_name}/{test_base_name}*.cpp",
-        f"engine/*/test/*/{test_base_name}*.cpp",
-        # Any match with test name
-        f"engine/**/test/**/{test_base_name}*.cpp",
-        # Broader search
-        f"**/{test_base_name}*.cpp",
-    ]
-    
-    for pattern in search_patterns:
-        full_pattern = os.path.join(tng_base, pattern)
-        matches = glob.glob(full_pattern, recursive=True)
-        
-        # Filter out build directories and non-test files
-        matches = [m for m in matches if '/build/' not in m and '/_build/' not in m]
-        
-        if matches:
-            # Prefer stimulus files
-            stimulus_matches = [m for m in matches if 'stimulus' in m]
-            if stimulus_matches:
-                return stimulus_matches[0]
-            return matches[0]
+        yield (m for d in test_dirs
+               for m in _cpp_files_with_prefix(os.path.join(d, suite_name), test_base_name))
+        yield (m for d in test_dirs for sub in _subdirs(d)
+               for m in _cpp_files_with_prefix(sub, test_base_name))
+        # Recursive fallbacks, answered from a cached listing of the tree
+        index = _tng_index(tng_base)
+        # Any match with test name (engine/**/test/**/<name>*.cpp)
+        yield (path for path in index.engine_test_files
+               if _cpp_name_has_prefix(path[path.rfind(os.sep) + 1:], test_base_name))
+        # Broader search (**/<name>*.cpp)
+        yield (path for path in index.cpp_files
+               if _cpp_name_has_prefix(path[path.rfind(os.sep) + 1:], test_base_name))
+    
+    for matches in engine_candidates():
+        # Take the first stimulus match as soon as it appears, else the
+        # first match of the pattern; build directories never count
+        first_match = None
+        for m in matches:
+            if '/build/' in m or '/_build/' in m:
+                continue
+            if 'stimulus' in m:
+                return m
+            if first_match is None:
+                first_match = m
+        if first_match is not None:
+            return first_match
     
     return None
 
 
+class _TngIndex:
+    """
+    Cached listing of a TNG tree for the recursive reference searches.
+    
+    Directories are visited depth-first in listing order with hidden entries
+    skipped, which is the order glob expands '**' in. Build directories are
+    pruned since their files are filtered out anyway.
+    """
+    
+    def __init__(self, tng_base: str):
+        # Directory -> (.cpp entries, subdirectories), in pre-order
+        self.tree = {}
+        self._walk(tng_base)
+        self._engine = os.path.join(tng_base, 'engine')
+        self._cpp_files = None
+        self._engine_test_files = None
+    
+    def _walk(self, directory: str):
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return
+        files = []
+        subdirs = []
+        self.tree[directory] = (files, subdirs)
+        for entry in entries:
+            name = entry.name
+            if name.startswith('.'):
+                continue
+            if name.endswith('.cpp'):
+                files.append(entry.path)
+            if name not in ('build', '_build') and entry.is_dir():
+                subdirs.append(entry.path)
+        for subdir in subdirs:
+            self._walk(subdir)
+    
+    def _preorder(self, directory: str):
+        """directory and every directory below it, in glob's '**' order"""
+        yield directory
+        for subdir in self.tree[directory][1]:
+            yield from self._preorder(subdir)
+    
+    @property
+    def cpp_files(self) -> list:
+        """Matches of '**/*.cpp', in glob order"""
+        if self._cpp_files is None:
+            self._cpp_files = [path for files, _ in self.tree.values() for path in files]
+        return self._cpp_files
+    
+    @property
+    def engine_test_files(self) -> list:
+        """Matches of 'engine/**/test/**/*.cpp', in glob order (repeats included)"""
+        if self._engine_test_files is None:
+            files = []
+            if self._engine in self.tree:
+                for directory in self._preorder(self._engine):
+                    test_dir = os.path.join(directory, 'test')
+                    if test_dir in self.tree:
+                        for sub in self._preorder(test_dir):
+                            files.extend(self.tree[sub][0])
+            self._engine_test_files = files
+        return self._engine_test_files
+
+
+# TNG tree listings, built once per base per process
+_TNG_FILE_INDEX = {}
+
+
+def _tng_index(tng_base: str) -> _TngIndex:
+    """Return the cached listing of tng_base, building it on first use"""
+    index = _TNG_FILE_INDEX.get(tng_base)
+    if index is None:
+        index = _TNG_FILE_INDEX[tng_base] = _TngIndex(tng_base)
+    return index
+
+
+def _cpp_name_has_prefix(name: str, prefix: str) -> bool:
+    """True if name matches '<prefix>*.cpp'"""
+    return name.startswith(prefix) and name.endswith('.cpp') and len(name) >= len(prefix) + 4
+
+
+def _subdirs(path: str) -> list:
+    """Non-hidden subdirectories of path in listing order (like glob's '*')"""
+    try:
+        with os.scandir(path) as entries:
+            return [entry.path for entry in entries
+                    if not entry.name.startswith('.') and entry.is_dir()]
+    except OSError:
+        return []
+
+
+def _cpp_files_with_prefix(directory: str, prefix: str) -> list:
+    """Entries of directory matching '<prefix>*.cpp' in listing order"""
+    try:
+        with os.scandir(directory) as entries:
+            return [entry.path for entry in entries
+                    if _cpp_name_has_prefix(entry.name, prefix)]
+    except OSError:
+        return []
+
+
+# Build output, VCS metadata and tooling trees never hold test sources
+_SKIP_DIRS = frozenset({"build", "_build", ".git", "CMakeFiles", "node_modules"})
+
+
+def count_test_sources(path: str) -> int:
+    """Count *test*.cpp files below path without following directory symlinks"""
+    count = 0
+    stack = [path]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    name = entry.name
+                    if entry.is_dir():
+                        if name not in _SKIP_DIRS and not entry.is_symlink():
+                            stack.append(entry.path)
+                    elif name.endswith('.cpp') and 'test' in name.lower():
+                        count += 1
+        except OSError:
+            continue
+    return count
+
+
+def _stem(path: str) -> str:
+    """File name without its final suffix, using plain string slicing"""
+    name = path[path.rfind(os.sep) + 1:]
+    dot = name.rfind('.')
+    return name[:dot] if dot > 0 else name
+
+
+def existing_suite_paths(tserver_base: str, suites: list) -> list:
+    """
+    Resolve configured suites to the paths that exist under tserver_base.
+    
+    Each suite category directory (e.g. suite/gpu) is listed once per call,
+    instead of stat-ing every suite path.
+    """
+    listings = {}
+    paths = []
+    for suite in suites:
+        category, _, name = suite.rstrip('/').rpartition('/')
+        children = listings.get(category)
+        if children is None:
+            try:
+                with os.scandir(os.path.join(tserver_base, category)) as entries:
+                    children = {entry.name for entry in entries if entry.is_dir()}
+            except OSError:
+                children = set()
+            listings[category] = children
+        if name in children:
+            paths.append(os.path.join(tserver_base, suite))
+    return paths
+
+
+# BatchProcessor instances keyed by output directory (None = default)
+_PROCESSORS = {}
+
+
+def _processor_for_output(output_dir: str = None):
+    """Return a shared BatchProcessor for output_dir, creating it on first use"""
+    processor = _PROCESSORS.get(output_dir)
+    if processor is None:
+        from batch_processor import BatchProcessor
+        processor = BatchProcessor() if output_dir is None else BatchProcessor(output_dir)
+        _PROCESSORS[output_dir] = processor
+    return processor
+
+
+def _suite_fingerprint(suite_path: str) -> tuple:
+    """
+    (path, mtime_ns, size) of every file under suite_path, in walk order.
+    
+    Matches the stats BatchProcessor.discover_tests records while walking.
+    Raises OSError if suite_path itself cannot be listed; unreadable
+    subdirectories are skipped, as discovery skips them.
+    """
+    files = []
+    stack = [suite_path]
+    while stack:
+        directory = stack.pop()
+        subdirs = []
+        try:
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            subdirs.append(entry.path)
+                        else:
+                            st = entry.stat()
+                            files.append((entry.path, st.st_mtime_ns, st.st_size))
+                    except OSError:
+                        continue  # Dangling symlink or entry removed meanwhile
+        except OSError:
+            if directory is suite_path:
+                raise
+            continue
+        stack.extend(reversed(subdirs))
+    return tuple(files)
+
+
+# Discovered tests per suite path, with the file stats seen while walking it
+_DISCOVERY_CACHE: "OrderedDict[str, tuple]" = OrderedDict()
+_DISCOVERY_CACHE_MAX = 64
+_discovery_lock = threading.Lock()
+
+
+def discover_suite_tests(suite_path: str) -> tuple:
+    """
+    Discover TServer tests in a suite directory, reusing earlier results.
+    
+    Results are cached per path and reused only while every file under the
+    suite keeps its path, mtime and size, so in-place edits to a test or
+    its XML are picked up by long-running callers. The first discovery of
+    a suite records those stats during its own walk, so cold runs walk
+    each suite once.
+    """
+    with _discovery_lock:
+        cached = _DISCOVERY_CACHE.get(suite_path)
+    
+    if cached is not None:
+        try:
+            fingerprint = _suite_fingerprint(suite_path)
+        except OSError:
+            # Suite removed since it was discovered, or unreadable
+            return ()
+        if fingerprint == cached[0]:
+            return cached[1]
+    
+    file_stats = []
+    tests = tuple(_processor_for_output().discover_tests(suite_path, file_stats=file_stats))
+    with _discovery_lock:
+        _DISCOVERY_CACHE[suite_path] = (tuple(file_stats), tests)
+        _DISCOVERY_CACHE.move_to_end(suite_path)
+        if len(_DISCOVERY_CACHE) > _DISCOVERY_CACHE_MAX:
+            _DISCOVERY_CACHE.popitem(last=False)
+    return tests
+
+
 def cmd_ips(args):
     """List all available IPs by scanning the TServer source directory"""
     tserver_path = args.tserver_path
     
     if not tserver_path:
-        print("\n" + "="*60)
-        print("ERROR: TServer source path is required!")
-        print("="*60)
+        _banner("ERROR: TServer source path is required!")
         print("\nUsage:")
         print("  python main.py ips --tserver-path /path/to/diag_gpu_ariel")
         return
@@ -129,68 +411,74 @@ def cmd_ips(args):
         print(f"\nError: TServer path does not exist: {tserver_path}")
         return
     
-    print(f"\n{'='*60}")
-    print("Discovering IP Blocks from TServer Source")
-    print(f"{'='*60}")
+    _banner("Discovering IP Blocks from TServer Source")
     print(f"\nTServer Path: {tserver_path}")
     
-    # Scan for suite directories
+    # Scan for suite directories; tserver_path is known to exist, so plain
+    # concatenation is enough to build the paths
+    sep = os.sep
+    base = tserver_path.rstrip(sep) or sep
     suite_dirs = [
-        os.path.join(tserver_path, "suite/gpu"),
-        os.path.join(tserver_path, "suite/cpu"),
-        os.path.join(tserver_path, "suite/nbridge"),
+        (category, f"{base}{sep}suite{sep}{category}")
+        for category in ("gpu", "cpu", "nbridge")
     ]
     
     discovered_ips = {}
+    candidates = []
     
-    for suite_base in suite_dirs:
+    for category, suite_base in suite_dirs:
         if not os.path.exists(suite_base):
             continue
         
-        category = os.path.basename(suite_base)
-        
         for item in os.listdir(suite_base):
-            item_path = os.path.join(suite_base, item)
+            item_path = f"{suite_base}{sep}{item}"
             if os.path.isdir(item_path):
-                cpp_files = []
-                for root, dirs, files in os.walk(item_path):
-                    cpp_files.extend([f for f in files if f.endswith('.cpp') and 'test' in f.lower()])
-                
-                if cpp_files or os.path.exists(os.path.join(item_path, "CMakeLists.txt")):
-                    suite_key = f"suite/{category}/{item}"
-                    discovered_ips[item] = {
-                        'category': category,
-                        'suite_path': suite_key,
-                        'full_path': item_path,
-                        'test_files': len(cpp_files),
-                    }
+                candidates.append((category, item, item_path))
+    
+    # Walk the IP directories concurrently; the work is dominated by syscalls
+    with ThreadPoolExecutor(max_workers=min(8, len(candidates) or 1)) as executor:
+        counts = executor.map(count_test_sources, [c[2] for c in candidates])
+        
+        for (category, item, item_path), test_count in zip(candidates, counts):
+            if test_count or os.path.lexists(f"{item_path}{sep}CMakeLists.txt"):
+                discovered_ips[item] = {
+                    'category': category,
+                    'suite_path': f"suite/{category}/{item}",
+                    'full_path': item_path,
+                    'test_files': test_count,
+                }
     
     if not discovered_ips:
         print("\nNo IP suites found.")
         return
     
-    print(f"\n{'IP Suite':<20} {'Category':<10} {'Tests':<8} {'Path'}")
-    print("-" * 70)
+    # Emit the table and summary with a single write
+    lines = [
+        f"\n{'IP Suite':<20} {'Category':<10} {'Tests':<8} {'Path'}",
+        "-" * 70,
+    ]
     
     for ip_name in sorted(discovered_ips.keys()):
         info = discovered_ips[ip_name]
-        print(f"{ip_name:<20} {info['category']:<10} {info['test_files']:<8} {info['suite_path']}")
-    
-    print(f"\n{'='*60}")
-    print(f"Found {len(discovered_ips)} IP suites")
-    print(f"{'='*60}")
-    
-    print(f"\nNext Steps:")
-    print(f"  # List tests for a specific IP:")
-    print(f"  python main.py ip <ip_name> --list --tserver-path {tserver_path}")
-    print(f"\n  # Translate a specific test:")
-    print(f"  python main.py translate <path/to/test.cpp> --tng-path <path/to/diag_tng>")
+        lines.append(f"{ip_name:<20} {info['category']:<10} {info['test_files']:<8} {info['suite_path']}")
+    
+    lines += [
+        f"\n{_BAR}",
+        f"Found {len(discovered_ips)} IP suites",
+        _BAR,
+        f"\nNext Steps:",
+        f"  # List tests for a specific IP:",
+        f"  python main.py ip <ip_name> --list --tserver-path {tserver_path}",
+        f"\n  # Translate a specific test:",
+        f"  python main.py translate <path/to/test.cpp> --tng-path <path/to/diag_tng>",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_ip(args):
     """Handle IP-based test listing"""
     config = load_config()
-    ip_config = get_ip_config(args.ip_name)
+    ip_config = get_ip_config(args.ip_name, config)
     
     if not ip_config:
         print(f"\nError: Unknown IP '{args.ip_name}'")
@@ -212,42 +500,52 @@ def cmd_ip(args):
         print(f"\nError: TServer path does not exist: {tserver_base}")
         return
     
-    print(f"\n{'='*60}")
-    print(f"Tests for IP: {args.ip_name.upper()}")
-    print(f"{'='*60}")
+    _banner(f"Tests for IP: {args.ip_name.upper()}")
     print(f"\nTServer Path: {tserver_base}")
     
     suites = ip_config.get('tserver_suites', [])
     print(f"Suites: {', '.join(suites)}")
     
     # Discover tests
-    processor = BatchProcessor()
     all_tests = []
     
-    for suite in suites:
-        suite_path = os.path.join(tserver_base, suite)
-        if os.path.exists(suite_path):
-            tests = processor.discover_tests(suite_path)
+    suite_paths = existing_suite_paths(tserver_base, suites)
+    
+    # Discover suites concurrently, keeping the configured suite order
+    with ThreadPoolExecutor(max_workers=min(8, len(suite_paths) or 1)) as executor:
+        for tests in executor.map(discover_suite_tests, suite_paths):
             all_tests.extend(tests)
     
     if not all_tests:
         print("\nNo tests found!")
         return
     
-    print(f"\nFound {len(all_tests)} tests:\n")
-    print(f"{'#':<4} {'Test Name':<40} {'File'}")
-    print("-" * 80)
+    # Emit the test table and footer with a single write
+    lines = [
+        f"\nFound {len(all_tests)} tests:\n",
+        f"{'#':<4} {'Test Name':<40} {'File'}",
+        "-" * 80,
+    ]
     
     for i, test in enumerate(all_tests, 1):
-        print(f"{i:<4} {test.test_name:<40} {os.path.basename(test.cpp_file)}")
+        lines.append(f"{i:<4} {test.test_name:<40} {os.path.basename(test.cpp_file)}")
     
-    print(f"\n{'='*60}")
-    print("To translate a test:")
-    print(f"  python main.py translate <path/to/test.cpp> --tng-path <path/to/diag_tng>")
+    lines += [
+        f"\n{_BAR}",
+        "To translate a test:",
+        f"  python main.py translate <path/to/test.cpp> --tng-path <path/to/diag_tng>",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def cmd_translate(args):
     """Handle test translation with TNG reference lookup"""
+    from spec_extractor import TServerExtractor
+    from spec_cache import get_or_extract
+    from tng_generator import TNGGenerator
+    from ai_translator import AITranslator
+    from dataclasses import asdict
+    
     cpp_file = args.cpp_file
     tng_path = args.tng_path
     output_dir = args.output or os.path.dirname(cpp_file) or "."
@@ -259,9 +557,7 @@ def cmd_translate(args):
         print(f"\nError: TServer test file not found: {cpp_file}")
         return
     
-    print(f"\n{'='*60}")
-    print("TServer to TNG Test Translation")
-    print(f"{'='*60}")
+    _banner("TServer to TNG Test Translation")
     print(f"\nSource: {cpp_file}")
     
     # Find corresponding TNG reference
@@ -276,9 +572,9 @@ def cmd_translate(args):
     # Step 1: Extract specification
     print(f"\n[Step 1/3] Extracting specification...")
     extractor = TServerExtractor(cpp_file)
-    spec = extractor.extract()
+    spec = extractor.spec = get_or_extract(cpp_file, extractor.xml_file)
     
-    cpp_name = os.path.splitext(os.path.basename(cpp_file))[0]
+    cpp_name = _stem(cpp_file)
     spec_file = os.path.join(output_dir, f"{cpp_name}_spec.yaml")
     extractor.save_spec(spec_file)
     print(f"  Specification: {spec_file}")
@@ -287,7 +583,8 @@ def cmd_translate(args):
     
     # Step 2: Generate TNG skeleton
     print(f"\n[Step 2/3] Generating TNG test skeleton...")
-    generator = TNGGenerator(spec_file)
+    spec_data = asdict(spec)  # shared by the generator and the translator
+    generator = TNGGenerator.from_spec(spec_data, spec_file=spec_file)
     output_cpp = os.path.join(output_dir, f"{cpp_name}_tng.cpp")
     generator.generate(output_cpp)
     print(f"  TNG Skeleton: {output_cpp}")
@@ -296,9 +593,10 @@ def cmd_translate(args):
     print(f"\n[Step 3/3] Generating AI translation context...")
     context_file = os.path.join(output_dir, f"{cpp_name}_ai_context.md")
     
-    translator = AITranslator(
-        spec_file, 
-        cpp_file, 
+    translator = AITranslator.from_spec(
+        spec_data,
+        cpp_file,
+        spec_file=spec_file,
         tng_path=tng_path,
         tng_reference_file=tng_reference
     )
@@ -306,9 +604,7 @@ def cmd_translate(args):
     print(f"  AI Context: {context_file}")
     
     # Summary
-    print(f"\n{'='*60}")
-    print("Translation Complete!")
-    print(f"{'='*60}")
+    _banner("Translation Complete!")
     
     print(f"\nGenerated Files:")
     print(f"  1. {spec_file}")
@@ -332,6 +628,25 @@ def cmd_translate(args):
         print(f"\n  5. Place final test in: {tng_dir}/")
 
 
+def print_quick_start():
+    """Print the Quick Start guide shown when no command is given"""
+    _banner("Quick Start")
+    print("\n1. Discover available IPs:")
+    print("   python main.py ips --tserver-path /path/to/diag_gpu_ariel")
+    print("\n2. List tests for an IP:")
+    print("   python main.py ip display --list --tserver-path /path/to/diag_gpu_ariel")
+    print("\n3. Translate a specific test:")
+    print("   python main.py translate /path/to/test.cpp --tng-path /path/to/diag_tng")
+
+
+# Subcommand name -> handler
+COMMANDS = {
+    'ips': cmd_ips,
+    'ip': cmd_ip,
+    'translate': cmd_translate,
+}
+
+
 def main():
     """Main entry point"""
     parser = argparse.ArgumentParser(
@@ -368,23 +683,12 @@ def main():
     
     args = parser.parse_args()
     
-    if args.command == 'ips':
-        cmd_ips(args)
-    elif args.command == 'ip':
-        cmd_ip(args)
-    elif args.command == 'translate':
-        cmd_translate(args)
+    handler = COMMANDS.get(args.command)
+    if handler:
+        handler(args)
     else:
         parser.print_help()
-        print("\n" + "="*60)
-        print("Quick Start")
-        print("="*60)
-        print("\n1. Discover available IPs:")
-        print("   python main.py ips --tserver-path /path/to/diag_gpu_ariel")
-        print("\n2. List tests for an IP:")
-        print("   python main.py ip display --list --tserver-path /path/to/diag_gpu_ariel")
-        print("\n3. Translate a specific test:")
-        print("   python main.py translate /path/to/test.cpp --tng-path /path/to/diag_tng")
+        print_quick_start()
 
 
 if __name__ == '__main__':
@@ -0,0 +1,150 @@
+#!/usr/bin/env python3
+"""
+Persistent Specification Cache
+
+Stores extracted test specifications in an SQLite database so unchanged
+TServer tests are not re-parsed on every run. Entries are keyed by the
+.cpp path and validated against a SHA-256 of the .cpp and .xml contents
+(and of the extractor source itself), so edits invalidate them automatically.
+
+Usage:
+    from spec_cache import get_or_extract
+    spec = get_or_extract(cpp_file, xml_file)
+
+Set TSERVER2TNG_NO_SPEC_CACHE=1 to bypass the cache.
+"""
+
+import os
+import hashlib
+import threading
+import yaml
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+try:
+    import sqlite3
+except ImportError:  # Python built without sqlite support
+    sqlite3 = None
+
+from spec_extractor import TServerExtractor, TestSpecification, Parameter, Variation, ApiCall
+
+# Prefer the LibYAML-backed loader/emitter when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader, CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader, SafeDumper as _SafeDumper
+
+
+CACHE_FILE = os.path.join(
+    os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+    'tserver2tng', 'specs.sqlite'
+)
+
+# Extractor source digest; a changed extractor must not serve stale specs
+_EXTRACTOR_DIGEST = hashlib.sha256(
+    Path(__file__).with_name('spec_extractor.py').read_bytes()
+).digest()
+
+_lock = threading.Lock()
+_conn = None
+_disabled = sqlite3 is None or os.environ.get('TSERVER2TNG_NO_SPEC_CACHE', '') not in ('', '0')
+
+
+def _connect():
+    """Open the cache database on first use; disables the cache on failure"""
+    global _conn, _disabled
+    if _conn is not None or _disabled:
+        return _conn
+    with _lock:
+        # Publish the connection only once its table exists, so no other
+        # thread can query a database that is still being set up
+        if _conn is None and not _disabled:
+            conn = None
+            try:
+                os.makedirs(os.path.dirname(CACHE_FILE), exist_ok=True)
+                conn = sqlite3.connect(CACHE_FILE, check_same_thread=False, timeout=30)
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS spec ("
+                    "path TEXT PRIMARY KEY, sha TEXT NOT NULL, yaml BLOB NOT NULL)"
+                )
+                conn.commit()
+                _conn = conn
+            except (OSError, sqlite3.Error):
+                if conn is not None:
+                    conn.close()
+                _disabled = True
+    return _conn
+
+
+def _content_sha(cpp_content: bytes, xml_file: Optional[str]) -> str:
+    """Digest of everything the extracted specification depends on"""
+    digest = hashlib.sha256(_EXTRACTOR_DIGEST)
+    digest.update(cpp_content)
+    if xml_file:
+        digest.update(b'\0' + os.fsencode(xml_file) + b'\0')
+        try:
+            digest.update(Path(xml_file).read_bytes())
+        except OSError:
+            pass
+    return digest.hexdigest()
+
+
+def _spec_from_dict(data: dict) -> TestSpecification:
+    """Rebuild a TestSpecification from its asdict() form"""
+    data = dict(data)
+    data['parameters'] = [Parameter(**p) for p in data.get('parameters', [])]
+    data['variations'] = [Variation(**v) for v in data.get('variations', [])]
+    data['api_calls'] = [ApiCall(**a) for a in data.get('api_calls', [])]
+    return TestSpecification(**data)
+
+
+def get_or_extract(cpp_file: str, xml_file: str = None,
+                   content: bytes = None) -> TestSpecification:
+    """
+    Return the specification for cpp_file, extracting it only on a cache miss.
+
+    Args:
+        cpp_file: Path to the TServer test .cpp file
+        xml_file: Path to the TServer test .xml file (optional, will try to find it)
+        content: Raw contents of cpp_file, if already read
+    """
+    if content is None:
+        content = Path(cpp_file).read_bytes()
+    extractor = TServerExtractor.from_bytes(content, cpp_file, xml_file)
+
+    conn = _connect()
+    if conn is None:
+        return extractor.extract()
+
+    path = os.path.abspath(cpp_file)
+    sha = _content_sha(content, extractor.xml_file)
+
+    try:
+        with _lock:
+            row = conn.execute("SELECT sha, yaml FROM spec WHERE path = ?", (path,)).fetchone()
+    except sqlite3.Error:
+        return extractor.extract()  # Unusable cache; extract as if disabled
+    if row and row[0] == sha:
+        try:
+            spec = _spec_from_dict(yaml.load(row[1], Loader=_SafeLoader))
+        except (yaml.YAMLError, TypeError):
+            pass  # Unreadable entry; fall through and replace it
+        else:
+            # The entry may come from a call that named the files differently
+            # (another cwd, a relative path); report them as named here
+            spec.source_cpp = cpp_file
+            spec.source_xml = extractor.xml_file or ""
+            return spec
+
+    spec = extractor.extract()
+    blob = yaml.dump(asdict(spec), Dumper=_SafeDumper, sort_keys=False,
+                     allow_unicode=True, encoding='utf-8')
+    with _lock:
+        try:
+            conn.execute("INSERT OR REPLACE INTO spec (path, sha, yaml) VALUES (?, ?, ?)",
+                         (path, sha, blob))
+            conn.commit()
+        except sqlite3.Error:
+            pass  # A read-only or busy cache must not fail the extraction
+    return spec
@@ -13,14 +13,23 @@ Usage:
 
 import re
 import os
+import sys
 import yaml
-import xml.etree.ElementTree as ET
-from dataclasses import dataclass, field, asdict
+from dataclasses import dataclass, field, fields
 from typing import List, Dict, Optional, Any
 from pathlib import Path
 
+# Prefer the LibYAML-backed emitter when PyYAML was built with it
+try:
+    from yaml import CSafeDumper as _SafeDumper
+except ImportError:
+    from yaml import SafeDumper as _SafeDumper
 
-@dataclass
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class Parameter:
     """Represents a test parameter"""
     name: str
@@ -30,7 +39,7 @@ class Parameter:
     pattern: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Variation:
     """Represents a test variation"""
     id: int
@@ -40,7 +49,7 @@ class Variation:
     function_name: str = ""  # The function called in this variation
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class ApiCall:
     """Represents an API call that needs to be mapped"""
     tserver_api: str
@@ -48,7 +57,7 @@ class ApiCall:
     suggested_tng: str = ""
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TestSpecification:
     """Complete test specification"""
     # Source info
@@ -82,11 +91,28 @@ class TestSpecification:
     functions: List[Dict[str, str]] = field(default_factory=list)
 
 
+class _SpecDumper(_SafeDumper):
+    """Safe dumper that serializes the spec dataclasses without asdict()"""
+    
+    def ignore_aliases(self, data):
+        # asdict() output never shared objects, so never emit anchors
+        return True
+
+
+def _represent_dataclass(dumper, obj):
+    """Represent a spec dataclass as a mapping in field order"""
+    return dumper.represent_dict({f.name: getattr(obj, f.name) for f in fields(obj)})
+
+
+for _cls in (Parameter, Variation, ApiCall, TestSpecification):
+    _SpecDumper.add_representer(_cls, _represent_dataclass)
+
+
 class TServerExtractor:
     """Extracts test specification from TServer test files"""
     
-    # Patterns for parsing C++ code
-    PATTERNS = {
+    # Patterns for parsing C++ code, compiled once at class load
+    PATTERNS = {name: re.compile(pattern) for name, pattern in {
         'class_decl': r'class\s+(\w+)\s*:\s*public\s+ts::Test',
         'include': r'#include\s*[<"]([^>"]+)[>"]',
         'parameter': r'Parameter<(\w+)>\s*\(\s*"(\w+)"(?:\s*,\s*([^)]+))?\)',
@@ -108,6 +134,27 @@ class TServerExtractor:
         'reg_read': r'RegRead\s*\([^)]+\)',
         'reg_write': r'RegWrite\s*\([^)]+\)',
         'core_log': r'CORE_LOG_(\w+)\s*\(',
+    }.items()}
+    
+    # Structural patterns, compiled once and shared by every extractor
+    _MAIN_BODY_RE = re.compile(r'Result\s+\w+::Main\(\)\s*{(.+?)^}', re.MULTILINE | re.DOTALL)
+    _SWITCH_RE = re.compile(r'switch\s*\(\s*(?:this->)?GetId\(\)\s*\)\s*{(.+?)}', re.DOTALL)
+    _CASE_RE = re.compile(r'case\s+(\d+)\s*:\s*(?://[^\n]*)?\s*(\w+)\s*\(\s*\)\s*;')
+    _CLASS_HEAD_RE = re.compile(r'class\s+\w+')
+    _PRIVATE_SECTION_RE = re.compile(r'private\s*:(.+?)(?:public|protected|$)', re.DOTALL)
+    _MEMBER_DECL_RE = re.compile(r'^\s*([\w:<>,\s]+)\s+(\w+)\s*;', re.MULTILINE)
+    # Anchored at identifier starts so each word is tried once, not once per
+    # suffix; a mid-word start could only repeat the whole-word match
+    _FUNCTION_RE = re.compile(r'(?<![\w:])[\w:]+\s+(\w+::)?(\w+)\s*\([^)]*\)')
+    _NOT_FUNCTIONS = frozenset(('if', 'while', 'for', 'switch', 'catch'))
+    
+    # XML UserParameter patterns and the C++ types they map to
+    _PATTERN_TYPES = {
+        'integer': 'int',
+        'bool': 'bool',
+        'hex': 'uint64_t',
+        'string': 'std::string',
+        'float': 'float',
     }
     
     def __init__(self, cpp_file: str, xml_file: str = None):
@@ -121,7 +168,26 @@ class TServerExtractor:
         self.cpp_file = cpp_file
         self.xml_file = xml_file or self._find_xml_file(cpp_file)
         self.spec = TestSpecification()
+        self._cpp_content = None
+    
+    @classmethod
+    def from_bytes(cls, content: bytes, cpp_file: str, xml_file: str = None) -> 'TServerExtractor':
+        """
+        Create an extractor for C++ source that has already been read.
         
+        Args:
+            content: Raw contents of cpp_file
+            cpp_file: Path to the TServer test .cpp file
+            xml_file: Path to the TServer test .xml file (optional, will try to find it)
+        """
+        extractor = cls(cpp_file, xml_file)
+        text = content.decode('utf-8')
+        if '\r' in text:
+            # Match the newline translation of the text-mode read in extract()
+            text = text.replace('\r\n', '\n').replace('\r', '\n')
+        extractor._cpp_content = text
+        return extractor
+
     def _find_xml_file(self, cpp_file: str) -> Optional[str]:
         """Try to find the corresponding XML file"""
         cpp_path = Path(cpp_file)
@@ -138,8 +204,10 @@ class TServerExtractor:
         self.spec.source_xml = self.xml_file or ""
         
         # Read and parse the C++ file
-        with open(self.cpp_file, 'r') as f:
-            cpp_content = f.read()
+        cpp_content = self._cpp_content
+        if cpp_content is None:
+            with open(self.cpp_file, 'r') as f:
+                cpp_content = f.read()
         
         self._extract_from_cpp(cpp_content)
         
@@ -152,15 +220,15 @@ class TServerExtractor:
     def _extract_from_cpp(self, content: str):
         """Extract information from C++ file"""
         # Extract includes
-        self.spec.includes = re.findall(self.PATTERNS['include'], content)
+        self.spec.includes = self.PATTERNS['include'].findall(content)
         
         # Extract class name
-        class_match = re.search(self.PATTERNS['class_decl'], content)
+        class_match = self.PATTERNS['class_decl'].search(content)
         if class_match:
             self.spec.class_name = class_match.group(1)
         
         # Extract TServerTestInstance
-        instance_match = re.search(self.PATTERNS['tserver_instance'], content)
+        instance_match = self.PATTERNS['tserver_instance'].search(content)
         if instance_match:
             self.spec.test_name = instance_match.group(1)
         
@@ -182,42 +250,41 @@ class TServerExtractor:
     def _extract_parameters(self, content: str):
         """Extract parameter declarations"""
         # Regular parameters
-        for match in re.finditer(self.PATTERNS['parameter'], content):
+        for match in self.PATTERNS['parameter'].finditer(content):
             param_type, param_name, default = match.groups()
             self.spec.parameters.append(Parameter(
                 name=param_name,
-                type=param_type,
+                type=sys.intern(param_type),
                 default=default.strip() if default else None
             ))
         
         # Optional parameters
-        for match in re.finditer(self.PATTERNS['parameter_opt'], content):
+        for match in self.PATTERNS['parameter_opt'].finditer(content):
             param_type, param_name = match.groups()
             self.spec.parameters.append(Parameter(
                 name=param_name,
-                type=param_type,
+                type=sys.intern(param_type),
                 description="Optional parameter"
             ))
     
     def _extract_variations(self, content: str):
         """Extract test variations from switch/case statements"""
         # Find the Main() function
-        main_match = re.search(r'Result\s+\w+::Main\(\)\s*{(.+?)^}', content, re.MULTILINE | re.DOTALL)
+        main_match = self._MAIN_BODY_RE.search(content)
         if not main_match:
             return
         
         main_body = main_match.group(1)
         
         # Find switch on GetId()
-        switch_match = re.search(r'switch\s*\(\s*(?:this->)?GetId\(\)\s*\)\s*{(.+?)}', main_body, re.DOTALL)
+        switch_match = self._SWITCH_RE.search(main_body)
         if not switch_match:
             return
         
         switch_body = switch_match.group(1)
         
         # Extract case statements
-        case_pattern = r'case\s+(\d+)\s*:\s*(?://[^\n]*)?\s*(\w+)\s*\(\s*\)\s*;'
-        for match in re.finditer(case_pattern, switch_body):
+        for match in self._CASE_RE.finditer(switch_body):
             var_id = int(match.group(1))
             func_name = match.group(2)
             self.spec.variations.append(Variation(
@@ -241,7 +308,7 @@ class TServerExtractor:
         ]
         
         for api_name, pattern in api_patterns:
-            for match in re.finditer(pattern, content):
+            for match in pattern.finditer(content):
                 self.spec.api_calls.append(ApiCall(
                     tserver_api=match.group(0),
                     context=api_name
@@ -249,18 +316,26 @@ class TServerExtractor:
     
     def _extract_member_variables(self, content: str):
         """Extract private member variables"""
-        # Find the class body
-        class_match = re.search(r'class\s+\w+[^{]*{(.+?)};', content, re.DOTALL)
-        if not class_match:
+        # Find the class body: from the first '{' after the first class
+        # head up to the next '};'. Plain finds keep this linear where a
+        # single DOTALL regex backtracks across the file when '};' is missing.
+        class_head = self._CLASS_HEAD_RE.search(content)
+        if not class_head:
+            return
+        body_start = content.find('{', class_head.end()) + 1
+        if not body_start:
+            return
+        body_end = content.find('};', body_start + 1)
+        if body_end < 0:
             return
         
-        class_body = class_match.group(1)
+        class_body = content[body_start:body_end]
         
         # Find private section
-        private_match = re.search(r'private\s*:(.+?)(?:public|protected|$)', class_body, re.DOTALL)
+        private_match = self._PRIVATE_SECTION_RE.search(class_body)
         if private_match:
             private_section = private_match.group(1)
-            for match in re.finditer(r'^\s*([\w:<>,\s]+)\s+(\w+)\s*;', private_section, re.MULTILINE):
+            for match in self._MEMBER_DECL_RE.finditer(private_section):
                 var_type = match.group(1).strip()
                 var_name = match.group(2)
                 if var_name.startswith('m_'):
@@ -272,11 +347,9 @@ class TServerExtractor:
     def _extract_functions(self, content: str):
         """Extract function declarations/definitions"""
         # Simple pattern to find function definitions
-        func_pattern = r'(?:void|Result|bool|int|[\w:]+)\s+(\w+::)?(\w+)\s*\([^)]*\)'
-        
-        for match in re.finditer(func_pattern, content):
+        for match in self._FUNCTION_RE.finditer(content):
             func_name = match.group(2)
-            if func_name not in ['if', 'while', 'for', 'switch', 'catch']:
+            if func_name not in self._NOT_FUNCTIONS:
                 self.spec.functions.append({
                     'name': func_name,
                     'signature': match.group(0)
@@ -284,35 +357,60 @@ class TServerExtractor:
     
     def _extract_from_xml(self):
         """Extract information from XML file"""
+        # Only tests with an .xml need the parser; keep it off the import path
+        import xml.etree.ElementTree as ET
         try:
-            tree = ET.parse(self.xml_file)
-            root = tree.getroot()
+            # Collect the attributes of interest in one streaming pass;
+            # start events arrive in document order, like findall('.//X')
+            root_attrib = None
+            user_params = []
+            tests = []
+            for event, elem in ET.iterparse(self.xml_file, events=('start', 'end')):
+                if event == 'start':
+                    if root_attrib is None:
+                        root_attrib = elem.attrib
+                    elif elem.tag == 'UserParameter':
+                        user_params.append(elem.attrib)
+                    elif elem.tag == 'Test':
+                        tests.append(elem.attrib)
+                elif elem.tag == 'Test':
+                    del elem[:]  # Variation bodies are not needed
             
             # Extract suite info
-            self.spec.suite_id = root.get('id', '')
-            self.spec.suite_description = root.get('description', '')
+            self.spec.suite_id = root_attrib.get('id', '')
+            self.spec.suite_description = root_attrib.get('description', '')
+            
+            # Name/id indices replace linear scans; setdefault keeps the
+            # first entry for duplicates, matching the previous next() lookup
+            params_by_name = {}
+            for p in self.spec.parameters:
+                params_by_name.setdefault(p.name, p)
+            variations_by_id = {}
+            for v in self.spec.variations:
+                variations_by_id.setdefault(v.id, v)
             
             # Extract UserParameters
-            for param in root.findall('.//UserParameter'):
+            for param in user_params:
                 name = param.get('name', '')
                 pattern = param.get('pattern', '')
                 description = param.get('description', '')
                 
                 # Check if we already have this parameter
-                existing = next((p for p in self.spec.parameters if p.name == name), None)
+                existing = params_by_name.get(name)
                 if existing:
                     existing.description = description
                     existing.pattern = pattern
                 else:
-                    self.spec.parameters.append(Parameter(
+                    params_by_name[name] = Parameter(
                         name=name,
                         type=self._pattern_to_type(pattern),
                         description=description,
                         pattern=pattern
-                    ))
+                    )
+                    self.spec.parameters.append(params_by_name[name])
             
             # Extract Test variations from XML
-            for test in root.findall('.//Test'):
+            for test in tests:
                 test_id = test.get('id', '')
                 alt_name = test.get('alt', '')
                 description = test.get('description', '')
@@ -320,54 +418,38 @@ class TServerExtractor:
                 # Update existing variation or create new one
                 try:
                     var_id = int(test_id)
-                    existing = next((v for v in self.spec.variations if v.id == var_id), None)
+                    existing = variations_by_id.get(var_id)
                     if existing:
                         existing.name = alt_name
                         existing.description = description
                     else:
-                        self.spec.variations.append(Variation(
+                        variations_by_id[var_id] = Variation(
                             id=var_id,
                             name=alt_name,
                             description=description
-                        ))
+                        )
+                        self.spec.variations.append(variations_by_id[var_id])
                 except ValueError:
                     pass
-                
-                # Extract variation-level parameters
-                for variation in test.findall('.//Variation'):
-                    var_id_str = variation.get('id', '')
-                    var_desc = variation.get('description', '')
-                    
-                    # Extract parameters for this variation
-                    var_params = {}
-                    for param in variation.findall('.//Parameter'):
-                        param_name = param.get('name', '')
-                        param_value = param.text
-                        var_params[param_name] = param_value
                     
         except ET.ParseError as e:
             print(f"Warning: Could not parse XML file: {e}")
     
     def _pattern_to_type(self, pattern: str) -> str:
         """Convert XML pattern to C++ type"""
-        mapping = {
-            'integer': 'int',
-            'bool': 'bool',
-            'hex': 'uint64_t',
-            'string': 'std::string',
-            'float': 'float',
-        }
-        return mapping.get(pattern, 'auto')
+        return self._PATTERN_TYPES.get(pattern, 'auto')
     
     def to_yaml(self) -> str:
         """Convert specification to YAML format"""
-        spec_dict = asdict(self.spec)
-        return yaml.dump(spec_dict, default_flow_style=False, sort_keys=False)
+        return yaml.dump(self.spec, Dumper=_SpecDumper, default_flow_style=False,
+                         sort_keys=False, allow_unicode=True)
     
     def save_spec(self, output_file: str):
         """Save specification to a YAML file"""
-        with open(output_file, 'w') as f:
-            f.write(self.to_yaml())
+        # Let the emitter write UTF-8 bytes straight to the file
+        with open(output_file, 'wb') as f:
+            yaml.dump(self.spec, f, Dumper=_SpecDumper, default_flow_style=False,
+                      sort_keys=False, allow_unicode=True, encoding='utf-8')
         print(f"Specification saved to: {output_file}")
 
 
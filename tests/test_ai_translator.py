@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for the AI context generator (ai_translator.py)
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from ai_translator import AITranslator
+
+TEST_SOURCE = """\
+class MpccModeTest : public ts::Test
+{
+public:
+    Result Main() override;
+private:
+    bool test1();
+};
+
+bool MpccModeTest::test1()
+{
+    return true;
+}
+
+Result MpccModeTest::Main()
+{
+    switch (GetId())
+    {
+        case 1: test1(); break;
+    }
+    return Result::Pass;
+}
+"""
+
+
+class CrlfSourceTest(unittest.TestCase):
+    """CRLF sources read the same as text-mode reads of the LF source"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def _translator(self, newline: str) -> AITranslator:
+        path = os.path.join(self.tmp, f"{len(newline)}_test.cpp")
+        Path(path).write_bytes(TEST_SOURCE.replace("\n", newline).encode('utf-8'))
+        return AITranslator.from_spec({'class_name': 'MpccModeTest'}, path)
+
+    def test_extract_function_has_no_carriage_returns(self):
+        lf, crlf = self._translator("\n"), self._translator("\r\n")
+        for name in ('test1', 'Main'):
+            self.assertEqual(crlf.extract_function(name), lf.extract_function(name))
+        self.assertNotIn("\r", crlf.extract_function('Main'))
+
+    def test_context_has_no_carriage_returns(self):
+        crlf = self._translator("\r\n")
+        self.assertNotIn("\r", crlf.generate_context_file())
+        self.assertEqual(crlf.cpp_content, TEST_SOURCE)
+
+
+class SourceLineRangesTest(unittest.TestCase):
+    """Line ranges listed in place of the embedded source"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_ranges_cover_each_function(self):
+        # test2's quoted brace defeats the brace scan, so its end is unknown
+        source = TEST_SOURCE.replace("Result MpccModeTest::Main()", """\
+bool MpccModeTest::test2()
+{
+    char c = '{';
+    return c != 0;
+}
+
+Result MpccModeTest::Main()""")
+        path = os.path.join(self.tmp, 'mpcc_mode_test.cpp')
+        Path(path).write_text(source)
+        variations = [{'id': i, 'function_name': name}
+                      for i, name in enumerate(('test1', 'test2', 'Main'), 1)]
+        translator = AITranslator.from_spec(
+            {'class_name': 'MpccModeTest', 'variations': variations}, path)
+
+        context = translator.generate_context_file(embed_source=False)
+        self.assertIn("| 1 | `test1` | 9-12 |", context)
+        self.assertIn("| 2 | `test2` | 14-? |", context)
+        self.assertIn("| 3 | `Main` | 20-27 |", context)
+
+
+class FuncIndexTest(unittest.TestCase):
+    """Definitions located by the function index"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_definition_inside_a_long_tail_is_found(self):
+        # The comment's unclosed "helper(" matches up to test1's brace
+        source = TEST_SOURCE.replace("bool MpccModeTest::test1()",
+                                     "// calls MpccModeTest::helper(\nbool MpccModeTest::test1()")
+        path = os.path.join(self.tmp, 'mpcc_mode_test.cpp')
+        Path(path).write_text(source)
+        translator = AITranslator.from_spec({'class_name': 'MpccModeTest'}, path)
+
+        self.assertEqual(translator.extract_function('test1'),
+                         "bool MpccModeTest::test1()\n{\n    return true;\n}")
+
+
+if __name__ == '__main__':
+    unittest.main()
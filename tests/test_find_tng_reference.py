@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+Tests for the TNG reference lookup in main.py
+"""
+
+import os
+import sys
+import glob
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import main
+
+
+class FindTngReferenceTest(unittest.TestCase):
+    """find_tng_reference must pick the file the glob patterns would"""
+
+    def setUp(self):
+        self.tng_base = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tng_base)
+        self.addCleanup(main._TNG_FILE_INDEX.clear)
+
+    def _touch(self, *parts: str):
+        path = os.path.join(self.tng_base, *parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        Path(path).touch()
+
+    def test_nested_test_dirs_follow_glob_order(self):
+        # engine/A/test/foo_1.cpp competes with files under engine/A/<x>/test
+        # for several <x>; some of them list before 'test' on any filesystem
+        self._touch('engine', 'A', 'test', 'foo_1.cpp')
+        for sibling in ('b', 'm', 'q1', 'w'):
+            self._touch('engine', 'A', sibling, 'test', 'foo_2.cpp')
+        self._touch('engine', 'A', 'test', 'x', 'test', 'foo_3.cpp')
+        self._touch('other', 'foo_4.cpp')
+
+        matches = glob.glob(os.path.join(self.tng_base, 'engine/**/test/**/foo*.cpp'),
+                            recursive=True)
+        self.assertEqual(main.find_tng_reference('suite/gpu/mpc/foo_test.cpp', self.tng_base),
+                         matches[0])
+
+    def test_broad_search_skips_build_dirs(self):
+        self._touch('build', 'foo_1.cpp')
+        self._touch('lib', 'foo_2.cpp')
+
+        self.assertEqual(main.find_tng_reference('suite/gpu/mpc/foo_test.cpp', self.tng_base),
+                         os.path.join(self.tng_base, 'lib', 'foo_2.cpp'))
+
+
+if __name__ == '__main__':
+    unittest.main()
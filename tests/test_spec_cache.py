@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+Tests for the persistent specification cache (spec_cache.py)
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import spec_cache
+
+TEST_SOURCE = b"""\
+class MpccModeTest : public ts::Test
+{
+private:
+    uint32_t m_count;
+};
+
+TServerTestInstance(MpccModeTest, MpccModeTest);
+"""
+
+
+class SpecCacheTest(unittest.TestCase):
+    """get_or_extract against a private cache database"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.cwd = os.getcwd()
+        self.addCleanup(os.chdir, self.cwd)
+
+        # Point the module at a fresh database for each test
+        saved = (spec_cache.CACHE_FILE, spec_cache._conn, spec_cache._disabled)
+        self.addCleanup(self._restore, saved)
+        spec_cache.CACHE_FILE = os.path.join(self.tmp, 'cache', 'specs.sqlite')
+        spec_cache._conn = None
+        spec_cache._disabled = spec_cache.sqlite3 is None
+        if spec_cache._disabled:
+            self.skipTest("sqlite3 is not available")
+
+    @staticmethod
+    def _restore(saved):
+        if spec_cache._conn is not None:
+            spec_cache._conn.close()
+        spec_cache.CACHE_FILE, spec_cache._conn, spec_cache._disabled = saved
+
+    def _write_test(self, *parts: str) -> str:
+        path = os.path.join(self.tmp, *parts)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        Path(path).write_bytes(TEST_SOURCE)
+        return path
+
+    def test_same_content_at_two_paths(self):
+        first = self._write_test('a', 'mpcc_mode_test.cpp')
+        second = self._write_test('b', 'mpcc_mode_test.cpp')
+
+        for path in (first, second, first, second):
+            spec = spec_cache.get_or_extract(path)
+            self.assertEqual(spec.source_cpp, path)
+            self.assertEqual(spec.class_name, 'MpccModeTest')
+
+    def test_hit_reports_the_path_as_named(self):
+        self._write_test('a', 'b', 'mpcc_mode_test.cpp')
+
+        os.chdir(self.tmp)
+        spec = spec_cache.get_or_extract(os.path.join('a', 'b', 'mpcc_mode_test.cpp'))
+        self.assertEqual(spec.source_cpp, os.path.join('a', 'b', 'mpcc_mode_test.cpp'))
+
+        # Same file, so the same cache entry, named relative to another cwd
+        os.chdir(os.path.join(self.tmp, 'a'))
+        spec = spec_cache.get_or_extract(os.path.join('b', 'mpcc_mode_test.cpp'))
+        self.assertEqual(spec.source_cpp, os.path.join('b', 'mpcc_mode_test.cpp'))
+        self.assertEqual(spec.source_xml, "")
+
+
+if __name__ == '__main__':
+    unittest.main()
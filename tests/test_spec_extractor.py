@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Tests for the TServer specification extractor (spec_extractor.py)
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from spec_extractor import TServerExtractor
+
+TEST_SOURCE = """\
+class MpccModeTest : public ts::Test
+{
+private:
+    bool test1();
+    uint32_t m_count;
+};
+
+bool MpccModeTest::test1()
+{
+    int count = Parameter<int>("loop_count", 10);
+    return RegRead(0x100) != 0;
+}
+
+Result MpccModeTest::Main()
+{
+    switch (GetId())
+    {
+        case 1: // first
+            test1();
+            break;
+    }
+    return Result::Pass;
+}
+"""
+
+
+class FromBytesTest(unittest.TestCase):
+    """from_bytes must extract what a text-mode read of the file does"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+
+    def test_crlf_source_matches_text_mode_read(self):
+        path = os.path.join(self.tmp, 'mpcc_mode_test.cpp')
+        Path(path).write_bytes(TEST_SOURCE.replace("\n", "\r\n").encode('utf-8'))
+
+        from_file = TServerExtractor(path).extract()
+        extractor = TServerExtractor.from_bytes(Path(path).read_bytes(), path)
+        from_bytes = extractor.extract()
+
+        self.assertEqual(from_bytes, from_file)
+        self.assertTrue(from_bytes.functions)
+        self.assertNotIn("\r", extractor.to_yaml())
+
+
+if __name__ == '__main__':
+    unittest.main()
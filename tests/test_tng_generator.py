@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Tests for the TNG test code generator (tng_generator.py)
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import unittest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from tng_generator import TNGGenerator
+
+
+class ReuseOutputTest(unittest.TestCase):
+    """generate() reuses an output only if it came from the same inputs"""
+
+    def setUp(self):
+        self.tmp = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.tmp)
+        self.output = os.path.join(self.tmp, 'out.cpp')
+
+    def _spec(self, name: str, class_name: str) -> str:
+        path = os.path.join(self.tmp, name, 'spec.yaml')
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        Path(path).write_text(f"class_name: {class_name}\n")
+        return path
+
+    def test_older_spec_for_the_same_output_regenerates(self):
+        alpha = self._spec('a', 'Alpha')
+        beta = self._spec('b', 'Beta')
+        os.utime(beta, ns=(0, 0))
+
+        TNGGenerator(alpha).generate(self.output)
+        code = TNGGenerator(beta).generate(self.output)
+
+        self.assertIn("BetaTNG", code)
+        self.assertEqual(Path(self.output).read_text(encoding='utf-8'), code)
+
+    def test_unchanged_inputs_reuse_output(self):
+        alpha = self._spec('a', 'Alpha')
+        code = TNGGenerator(alpha).generate(self.output)
+
+        # Reuse returns the file as written, not a fresh generation
+        Path(self.output).write_text(code + "// kept\n", encoding='utf-8')
+        self.assertEqual(TNGGenerator(alpha).generate(self.output), code + "// kept\n")
+        self.assertEqual(TNGGenerator(alpha).generate(self.output, force=True), code)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -10,14 +10,31 @@ Usage:
     generator.generate(output_file)
 """
 
+import io
 import os
-import yaml
-from dataclasses import dataclass
+import re
+import sys
+import hashlib
+import functools
+from dataclasses import dataclass, asdict, is_dataclass
 from typing import List, Dict, Any, Optional
 from pathlib import Path
 
+from yaml_cache import load_yaml_cached
 
-@dataclass
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@functools.lru_cache(maxsize=None)
+def _generator_digest() -> bytes:
+    """Digest of this module's source, standing in for a generator version"""
+    with open(__file__, 'rb') as f:
+        return hashlib.sha256(f.read()).digest()
+
+
+@dataclass(**_SLOTS)
 class GeneratorConfig:
     """Configuration for code generation"""
     indent: str = "    "
@@ -25,85 +42,244 @@ class GeneratorConfig:
     include_comments: bool = True
 
 
+class _Param:
+    """A specification parameter with the names and type derived from it"""
+    __slots__ = ('raw', 'name', 'pascal', 'ctype')
+    
+    def __init__(self, raw: Dict[str, Any], name: str, pascal: str, ctype: str):
+        self.raw = raw
+        self.name = name
+        self.pascal = pascal
+        self.ctype = ctype
+
+
 class TNGGenerator:
     """Generates TNG test code from specification"""
     
-    def __init__(self, spec_file: str, mappings_file: str = None):
+    # Header line recording the inputs a skeleton was generated from
+    _DIGEST_NOTE = " * @note Generator inputs digest: "
+    
+    # Mapping sections searched by _lookup_mapping, in priority order
+    _MAPPING_SECTIONS = ('device_access', 'memory', 'registers', 'logging', 'verification')
+    
+    # CamelCase word starts and lower/upper boundaries for _to_snake_case
+    _CAMEL_WORD_RE = re.compile('(.)([A-Z][a-z]+)')
+    _CAMEL_BOUNDARY_RE = re.compile('([a-z0-9])([A-Z])')
+    
+    # TServer parameter types and their TNG spellings; others pass through
+    _TYPE_MAP = {
+        'int': 'int32_t',
+        'uint': 'uint32_t',
+        'uintmax_t': 'uint64_t',
+        'size_t': 'size_t',
+        'bool': 'bool',
+        'float': 'float',
+        'double': 'double',
+        'string': 'std::string',
+    }
+    
+    # Member variable type fragments rewritten for TNG, first match wins
+    _MEMBER_TYPE_MAP = (
+        ('boost::optional', 'std::optional'),
+    )
+    
+    # Includes every generated test starts with, joined once at import
+    _BASE_INCLUDES = "\n".join([
+        "#include <test/cmn/basic_monolithic_test.h>",
+        "#include <test/cmn/monolithic_support.h>",
+        "#include <test/cmn/random.h>",
+        "",
+        "#include <hal/device.h>",
+        "",
+        "#include <cfg/config.h>",
+        "",
+        "#include <algorithm>",
+        "#include <cstring>",
+    ])
+    
+    # API call context fragments and the include line each one calls for
+    _IP_INCLUDES = {
+        'HalGpu': "// TODO: Add IP-specific includes for register access",
+        'RegRead': "// TODO: Add IP-specific includes for register access",
+        'RegWrite': "// TODO: Add IP-specific includes for register access",
+        'palloc': "#include <ip/buffer_util.h>",
+    }
+    _IP_INCLUDE_RE = re.compile('|'.join(_IP_INCLUDES))
+    
+    # Test case map placeholder per raw parameter type, for parameters
+    # without a default; any other type gets '{}'
+    _PLACEHOLDERS = {
+        'bool': 'false',
+        'int': '0',
+        'uint32_t': '0',
+        'size_t': '0',
+        'uintmax_t': '0',
+    }
+    
+    def __init__(self, spec_file: str, mappings_file: str = None, spec: Dict[str, Any] = None):
         """
         Initialize the generator.
         
         Args:
             spec_file: Path to the test specification YAML file
             mappings_file: Path to API mappings YAML file
+            spec: Already-loaded specification; spec_file is not read if given
         """
         self.spec_file = spec_file
         self.mappings_file = mappings_file or self._get_default_mappings()
         self.config = GeneratorConfig()
         
-        # Load specification
-        with open(spec_file, 'r') as f:
-            self.spec = yaml.safe_load(f)
+        # Load specification; only a spec read from spec_file lets generate()
+        # reuse an existing output generated from the same inputs
+        self._spec_from_file = spec is None
+        if spec is not None:
+            self.spec = spec
+        else:
+            self.spec = load_yaml_cached(spec_file)
+        
+        # Load API mappings (parsed once per process while unchanged)
+        self.mappings = load_yaml_cached(self.mappings_file)
+        
+        # Lower-cased mapping keys in lookup order, and resolved lookups
+        self._mapping_index = [
+            (key.lower(), value.get('tng', '') if isinstance(value, dict) else str(value))
+            for section in self._MAPPING_SECTIONS
+            for key, value in self.mappings.get(section, {}).items()
+        ]
+        self._mapping_cache = {}
+        self._digest = None
+        
+        # Name of the generated TNG test class, used by most sections
+        self._tng_class_name = self.spec.get('class_name', 'GeneratedTest') + "TNG"
+        
+        # Per-parameter names and types shared by the class generators
+        self._params = [
+            _Param(param, param.get('name', 'unknown'),
+                   self._to_pascal_case(param.get('name', 'unknown')),
+                   self._map_type(param.get('type', 'int')))
+            for param in self.spec.get('parameters', [])
+        ]
+        
+        # First API call seen for each context, in order of appearance
+        self._unique_contexts = {}
+        for call in self.spec.get('api_calls', []):
+            self._unique_contexts.setdefault(call.get('context', ''), call)
+    
+    @classmethod
+    def from_spec(cls, spec, mappings_file: str = None, spec_file: str = None) -> 'TNGGenerator':
+        """
+        Create a generator from an in-memory specification.
         
-        # Load API mappings
-        with open(self.mappings_file, 'r') as f:
-            self.mappings = yaml.safe_load(f)
+        Args:
+            spec: TestSpecification or the equivalent dict
+            mappings_file: Path to API mappings YAML file
+            spec_file: Path the specification was saved to (informational)
+        """
+        if is_dataclass(spec):
+            spec = asdict(spec)
+        return cls(spec_file, mappings_file, spec=spec)
     
     def _get_default_mappings(self) -> str:
         """Get path to default API mappings file"""
         script_dir = Path(__file__).parent
         return str(script_dir / "api_mappings.yaml")
     
-    def generate(self, output_file: str = None) -> str:
+    def generate(self, output_file: str = None, force: bool = False) -> str:
         """
         Generate TNG test code.
         
         Args:
             output_file: Optional path to write the generated code
+            force: Regenerate output_file even if it was generated from the same inputs
             
         Returns:
             Generated code as string
         """
+        if output_file and not force and self._output_is_current(output_file):
+            with open(output_file, 'rb') as f:
+                code = f.read().decode('utf-8')
+            print(f"TNG test code up to date: {output_file}")
+            return code
+        
         code = self._generate_code()
         
         if output_file:
-            with open(output_file, 'w') as f:
-                f.write(code)
+            # Encode once and hand the file a single write, bypassing the
+            # text layer's chunked encoding
+            with open(output_file, 'wb') as f:
+                f.write(code.encode('utf-8'))
             print(f"Generated TNG test code: {output_file}")
         
         return code
     
+    def _inputs_digest(self) -> str:
+        """Digest of the specification, API mappings and generator source"""
+        if self._digest is None:
+            h = hashlib.sha256(_generator_digest())
+            for data in (self.spec, self.mappings):
+                h.update(repr(data).encode('utf-8'))
+                h.update(b'\0')
+            self._digest = h.hexdigest()[:32]
+        return self._digest
+    
+    def _output_is_current(self, output_file: str) -> bool:
+        """True if output_file's header records the current inputs digest"""
+        if not self._spec_from_file:
+            return False
+        try:
+            with open(output_file, 'rb') as f:
+                head = f.read(4096).decode('utf-8', errors='replace')
+        except OSError:
+            return False
+        return f"{self._DIGEST_NOTE}{self._inputs_digest()}\n" in head
+    
     def _generate_code(self) -> str:
         """Generate the complete TNG test code"""
-        parts = []
+        buf = io.StringIO()
+        self._write_code(buf)
+        return buf.getvalue()
+    
+    def _write_code(self, out):
+        """
+        Write the complete TNG test code to a text stream.
+        
+        Args:
+            out: Writable text stream (file or io.StringIO)
+        """
+        write = out.write
         
         # File header
-        parts.append(self._generate_header())
+        write(self._generate_header())
         
         # Includes
-        parts.append(self._generate_includes())
+        write("\n")
+        write(self._generate_includes())
         
         # Anonymous namespace start
-        parts.append("\nnamespace\n{")
+        write("\n\nnamespace\n{")
         
         # Class definition
-        parts.append(self._generate_class())
+        write("\n")
+        write(self._generate_class())
         
         # Test specification and registration
-        parts.append(self._generate_registration())
+        write("\n")
+        write(self._generate_registration())
         
         # Constructor
-        parts.append(self._generate_constructor())
+        write("\n")
+        write(self._generate_constructor())
         
         # setUp method
-        parts.append(self._generate_setup())
+        write("\n")
+        write(self._generate_setup())
         
         # run method
-        parts.append(self._generate_run())
+        write("\n")
+        write(self._generate_run())
         
         # Anonymous namespace end
-        parts.append("\n}  // anonymous namespace")
-        
-        return "\n".join(parts)
+        write("\n\n}  // anonymous namespace")
     
     def _generate_header(self) -> str:
         """Generate file header comment"""
@@ -115,45 +291,25 @@ class TNGGenerator:
  * @file {self._to_snake_case(class_name)}_test.cpp
  * @brief {description}
  * @note Auto-generated from TServer test: {source_cpp}
+{self._DIGEST_NOTE}{self._inputs_digest()}
  * @copyright Copyright © 2025 Advanced Micro Devices, Inc. All rights reserved.
  */
 '''
     
     def _generate_includes(self) -> str:
         """Generate include statements"""
-        includes = [
-            "#include <test/cmn/basic_monolithic_test.h>",
-            "#include <test/cmn/monolithic_support.h>",
-            "#include <test/cmn/random.h>",
-            "",
-            "#include <hal/device.h>",
-            "",
-            "#include <cfg/config.h>",
-            "",
-            "#include <algorithm>",
-            "#include <cstring>",
-        ]
-        
         # Add IP-specific includes based on detected API calls
-        api_calls = self.spec.get('api_calls', [])
-        ip_includes = set()
+        ip_includes = {self._IP_INCLUDES[token]
+                       for context in self._unique_contexts
+                       for token in self._IP_INCLUDE_RE.findall(context)}
         
-        for call in api_calls:
-            context = call.get('context', '')
-            if 'HalGpu' in context or 'RegRead' in context or 'RegWrite' in context:
-                ip_includes.add("// TODO: Add IP-specific includes for register access")
-            if 'palloc' in context:
-                ip_includes.add("#include <ip/buffer_util.h>")
-        
-        if ip_includes:
-            includes.append("")
-            includes.extend(sorted(ip_includes))
-        
-        return "\n".join(includes)
+        if not ip_includes:
+            return self._BASE_INCLUDES
+        return self._BASE_INCLUDES + "\n\n" + "\n".join(sorted(ip_includes))
     
     def _generate_class(self) -> str:
         """Generate the test class definition"""
-        class_name = self.spec.get('class_name', 'GeneratedTest') + "TNG"
+        class_name = self._tng_class_name
         description = self.spec.get('suite_description', '')
         feature = self.spec.get('feature', 'unknown')
         sub_characteristic = self.spec.get('sub_characteristic', 'unknown')
@@ -199,17 +355,14 @@ private:
     
     def _generate_parameter_structs(self) -> str:
         """Generate parameter struct definitions"""
-        params = self.spec.get('parameters', [])
-        if not params:
+        if not self._params:
             return "    // No parameters"
         
         structs = []
-        for param in params:
-            name = param.get('name', 'unknown')
-            ptype = self._map_type(param.get('type', 'int'))
-            description = param.get('description', '')
-            
-            struct_name = self._to_pascal_case(name)
+        for param in self._params:
+            name = param.name
+            ptype = param.ctype
+            struct_name = param.pascal
             structs.append(f'''    struct {struct_name} : public diag::value::ScalarValue<{ptype}>
     {{
         static constexpr std::string_view k_Name = "{name}";
@@ -220,11 +373,10 @@ private:
     
     def _generate_parameter_list(self) -> str:
         """Generate parameter list for IntrospectableStructure"""
-        params = self.spec.get('parameters', [])
-        if not params:
+        if not self._params:
             return "/* no parameters */"
         
-        names = [self._to_pascal_case(p.get('name', 'unknown')) for p in params]
+        names = [p.pascal for p in self._params]
         return ",\n                                                           ".join(names)
     
     def _generate_test_case_map(self) -> str:
@@ -233,28 +385,20 @@ private:
         if not variations:
             return "        {1, {/* default parameters */}},"
         
+        # Parameter values (placeholders) are the same for every variation
+        param_values = [
+            f"/*{param.get('name')}*/ "
+            f"{param.get('default') or self._PLACEHOLDERS.get(param.get('type', 'int'), '{}')}"
+            for param in (p.raw for p in self._params)
+        ]
+        param_str = ", ".join(param_values) if param_values else "/* no params */"
+        
         entries = []
         for var in variations:
             var_id = var.get('id', 1)
             description = var.get('description', '')
             func_name = var.get('function_name', '')
             
-            # Generate parameter values (placeholders)
-            params = self.spec.get('parameters', [])
-            param_values = []
-            for param in params:
-                ptype = param.get('type', 'int')
-                default = param.get('default')
-                if default:
-                    param_values.append(f"/*{param.get('name')}*/ {default}")
-                elif ptype == 'bool':
-                    param_values.append(f"/*{param.get('name')}*/ false")
-                elif ptype in ['int', 'uint32_t', 'size_t', 'uintmax_t']:
-                    param_values.append(f"/*{param.get('name')}*/ 0")
-                else:
-                    param_values.append(f"/*{param.get('name')}*/ {{}}")
-            
-            param_str = ", ".join(param_values) if param_values else "/* no params */"
             comment = f"  // {func_name}: {description}" if func_name else f"  // {description}"
             entries.append(f"        {{{var_id}, {{{param_str}}}}},{comment}")
         
@@ -282,7 +426,7 @@ private:
     
     def _generate_registration(self) -> str:
         """Generate test registration code"""
-        class_name = self.spec.get('class_name', 'GeneratedTest') + "TNG"
+        class_name = self._tng_class_name
         
         return f'''
 constexpr tng::test::impl::MonolithicTestSpecification<{class_name}> k_TestSpec;
@@ -292,7 +436,7 @@ const bool k_TestRegistered = tng::test::registerTest(k_TestSpec);
     
     def _generate_constructor(self) -> str:
         """Generate constructor implementation"""
-        class_name = self.spec.get('class_name', 'GeneratedTest') + "TNG"
+        class_name = self._tng_class_name
         
         return f'''
 {class_name}::{class_name}(const tng::test::Parameters& parameters, tng::test::Environment& environment) :
@@ -304,7 +448,7 @@ const bool k_TestRegistered = tng::test::registerTest(k_TestSpec);
     
     def _generate_setup(self) -> str:
         """Generate setUp method"""
-        class_name = self.spec.get('class_name', 'GeneratedTest') + "TNG"
+        class_name = self._tng_class_name
         
         return f'''
 tng::test::SetUpResult {class_name}::setUp(tng::test::ExecutionContext& /* context */)
@@ -323,7 +467,7 @@ tng::test::SetUpResult {class_name}::setUp(tng::test::ExecutionContext& /* conte
     
     def _generate_run(self) -> str:
         """Generate run method with TODO comments for each variation"""
-        class_name = self.spec.get('class_name', 'GeneratedTest') + "TNG"
+        class_name = self._tng_class_name
         variations = self.spec.get('variations', [])
         
         # Generate variation handling code
@@ -364,56 +508,36 @@ tng::test::Monitor {class_name}::run(const tng::test::ExecutionContext& /* conte
     
     def _generate_api_hints(self) -> str:
         """Generate API translation hints as comments"""
-        api_calls = self.spec.get('api_calls', [])
-        if not api_calls:
+        if not self._unique_contexts:
             return "    // No special API calls detected"
         
         hints = []
-        seen = set()
         
-        for call in api_calls:
+        for context, call in self._unique_contexts.items():
             tserver_api = call.get('tserver_api', '')
-            context = call.get('context', '')
-            
-            if context in seen:
-                continue
-            seen.add(context)
             
             # Look up mapping
             tng_api = self._lookup_mapping(context)
             if tng_api:
-                hints.append(f"    // {context}:")
-                hints.append(f"    //   TServer: {tserver_api[:60]}...")
-                hints.append(f"    //   TNG: {tng_api}")
-                hints.append("")
+                # One element per hint block; the join supplies the blank line
+                hints.append(f"    // {context}:\n"
+                             f"    //   TServer: {tserver_api[:60]}...\n"
+                             f"    //   TNG: {tng_api}\n")
         
         return "\n".join(hints) if hints else "    // No special API calls detected"
     
     def _lookup_mapping(self, context: str) -> str:
         """Look up TNG equivalent for TServer API"""
-        mapping_sections = ['device_access', 'memory', 'registers', 'logging', 'verification']
-        
-        for section in mapping_sections:
-            section_mappings = self.mappings.get(section, {})
-            for key, value in section_mappings.items():
-                if context.lower() in key.lower():
-                    return value.get('tng', '') if isinstance(value, dict) else str(value)
-        
-        return ""
+        tng_api = self._mapping_cache.get(context)
+        if tng_api is None:
+            needle = context.lower()
+            tng_api = next((value for key, value in self._mapping_index if needle in key), "")
+            self._mapping_cache[context] = tng_api
+        return tng_api
     
     def _map_type(self, tserver_type: str) -> str:
         """Map TServer type to TNG type"""
-        type_map = {
-            'int': 'int32_t',
-            'uint': 'uint32_t',
-            'uintmax_t': 'uint64_t',
-            'size_t': 'size_t',
-            'bool': 'bool',
-            'float': 'float',
-            'double': 'double',
-            'string': 'std::string',
-        }
-        return type_map.get(tserver_type, tserver_type)
+        return self._TYPE_MAP.get(tserver_type, tserver_type)
     
     def _map_member_var_type(self, tserver_type: str) -> Optional[str]:
         """Map TServer member variable type to TNG"""
@@ -422,11 +546,7 @@ tng::test::Monitor {class_name}::run(const tng::test::ExecutionContext& /* conte
             return None  # TNG has built-in logging
         
         # Map common types
-        type_map = {
-            'boost::optional': 'std::optional',
-        }
-        
-        for old, new in type_map.items():
+        for old, new in self._MEMBER_TYPE_MAP:
             if old in tserver_type:
                 return tserver_type.replace(old, new)
         
@@ -434,39 +554,87 @@ tng::test::Monitor {class_name}::run(const tng::test::ExecutionContext& /* conte
     
     def _to_snake_case(self, name: str) -> str:
         """Convert CamelCase to snake_case"""
-        import re
-        s1 = re.sub('(.)([A-Z][a-z]+)', r'\1_\2', name)
-        return re.sub('([a-z0-9])([A-Z])', r'\1_\2', s1).lower()
+        s1 = self._CAMEL_WORD_RE.sub(r'\1_\2', name)
+        return self._CAMEL_BOUNDARY_RE.sub(r'\1_\2', s1).lower()
     
     def _to_pascal_case(self, name: str) -> str:
         """Convert snake_case to PascalCase"""
-        return ''.join(word.capitalize() for word in name.split('_'))
+        return ''.join(map(str.capitalize, name.split('_')))
+
+
+def _default_output(spec_file: str) -> str:
+    """Default output file name for a specification file"""
+    spec_name = os.path.splitext(os.path.basename(spec_file))[0]
+    return f"{spec_name}_tng_test.cpp"
+
+
+def _generate_one(spec_file: str, mappings_file: str, output_file: str, force: bool) -> str:
+    """Generate one skeleton; module-level so process pool workers can run it"""
+    TNGGenerator(spec_file, mappings_file).generate(output_file, force=force)
+    # Flush per spec so worker lines never split the parent's output lines
+    sys.stdout.flush()
+    return output_file
 
 
 def main():
     """Main entry point for command-line usage"""
     import argparse
+    from concurrent.futures import ProcessPoolExecutor
     
     parser = argparse.ArgumentParser(description='Generate TNG test code from specification')
-    parser.add_argument('spec_file', help='Path to test specification YAML file')
+    parser.add_argument('spec_file', nargs='+', help='Path(s) to test specification YAML files')
     parser.add_argument('--mappings', '-m', help='Path to API mappings YAML file')
-    parser.add_argument('--output', '-o', help='Output .cpp file')
+    parser.add_argument('--output', '-o', help='Output .cpp file (single spec only)')
+    parser.add_argument('--force', '-f', action='store_true',
+                        help='Regenerate even if the output was generated from the same inputs')
+    parser.add_argument('--workers', '-w', type=int, default=os.cpu_count() or 1,
+                        help='Parallel worker processes for multiple specs')
     
     args = parser.parse_args()
     
-    generator = TNGGenerator(args.spec_file, args.mappings)
+    if args.output and len(args.spec_file) > 1:
+        parser.error("--output can only be used with a single spec file")
     
-    output_file = args.output
-    if not output_file:
-        # Generate default output filename
-        import os
-        spec_name = os.path.splitext(os.path.basename(args.spec_file))[0]
-        output_file = f"{spec_name}_tng_test.cpp"
+    if len(args.spec_file) == 1:
+        spec_file = args.spec_file[0]
+        output_file = args.output or _default_output(spec_file)
+        
+        TNGGenerator(spec_file, args.mappings).generate(output_file, force=args.force)
+        
+        print(f"\n=== Generated TNG Test ===")
+        print(f"Output: {output_file}")
+        return
     
-    generator.generate(output_file)
+    # Every output lands in the cwd under its spec's base name; refuse specs
+    # that would write the same file rather than let workers race on it
+    outputs = {}
+    for spec_file in args.spec_file:
+        outputs.setdefault(os.path.abspath(_default_output(spec_file)), []).append(spec_file)
+    clashes = [f"{os.path.basename(output)} <- {', '.join(specs)}"
+               for output, specs in outputs.items() if len(specs) > 1]
+    if clashes:
+        parser.error("spec files would write the same output file:\n  " + "\n  ".join(clashes))
+    
+    # Codegen is CPU-bound Python, so fan specs out across processes; each
+    # worker parses the mappings once and reuses them from its YAML cache
+    failed = 0
+    with ProcessPoolExecutor(max_workers=max(1, min(args.workers, len(args.spec_file)))) as executor:
+        futures = [
+            executor.submit(_generate_one, spec_file, args.mappings,
+                            _default_output(spec_file), args.force)
+            for spec_file in args.spec_file
+        ]
+        
+        print(f"\n=== Generated TNG Tests ===")
+        for spec_file, future in zip(args.spec_file, futures):
+            try:
+                print(f"Output: {future.result()}")
+            except Exception as e:
+                failed += 1
+                print(f"Failed: {spec_file}: {e}")
     
-    print(f"\n=== Generated TNG Test ===")
-    print(f"Output: {output_file}")
+    if failed:
+        sys.exit(1)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+"""
+Parsed YAML Cache
+
+Keeps parsed YAML documents (specifications, API mappings) in memory so
+repeated loads of an unchanged file skip the parse. Entries are keyed by
+absolute path, mtime and size, so edits are picked up automatically.
+
+Usage:
+    from yaml_cache import load_yaml_cached
+    mappings = load_yaml_cached(mappings_file)
+"""
+
+import os
+import copy
+import threading
+import yaml
+from collections import OrderedDict
+
+# Prefer the LibYAML-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:
+    from yaml import SafeLoader as _SafeLoader
+
+
+# Parsed YAML documents keyed by (absolute path, mtime, size)
+_YAML_CACHE: "OrderedDict[tuple, dict]" = OrderedDict()
+_YAML_CACHE_MAX = 100
+_lock = threading.Lock()
+
+
+def load_yaml_cached(path: str) -> dict:
+    """
+    Load a YAML file, reusing the parsed tree while the file is unchanged.
+
+    Every call returns a private deep copy, so callers may mutate the
+    result freely without affecting the cache or each other.
+
+    Args:
+        path: Path to the YAML file
+    """
+    st = os.stat(path)
+    key = (os.path.abspath(path), st.st_mtime_ns, st.st_size)
+
+    with _lock:
+        data = _YAML_CACHE.get(key)
+        if data is not None:
+            _YAML_CACHE.move_to_end(key)
+
+    if data is None:
+        with open(path, 'rb') as f:
+            data = yaml.load(f, Loader=_SafeLoader)
+        with _lock:
+            _YAML_CACHE[key] = data
+            if len(_YAML_CACHE) > _YAML_CACHE_MAX:
+                _YAML_CACHE.popitem(last=False)
+
+    return copy.deepcopy(data)